@@ -0,0 +1,86 @@
+"""
+Compare two sets of benchmark results produced by benchmarks/run.py.
+
+Exits with a non-zero status if any measurement regressed by more than the
+given threshold (relative to the baseline). Sub-millisecond measurements are
+much noisier on shared machines, so they are held to a separate, larger
+threshold. Measurements that only exist in one of the two files are reported
+but never treated as regressions.
+
+usage: python benchmarks/compare.py BASELINE CURRENT [--threshold FRACTION]
+                                    [--fast-threshold FRACTION]
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+# measurements (in seconds) below this are compared with --fast-threshold
+FAST_CUTOFF = 1e-3
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser()
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="maximum tolerated relative slowdown (default: 0.25)",
+    )
+    parser.add_argument(
+        "--fast-threshold",
+        type=float,
+        default=1.0,
+        help=(
+            "maximum tolerated relative slowdown for sub-millisecond "
+            "measurements (default: 1.0)"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, dict[str, float]] = json.loads(args.baseline.read_text())
+    current: dict[str, dict[str, float]] = json.loads(args.current.read_text())
+
+    regressions: list[str] = []
+    for variant in sorted(current):
+        if variant not in baseline:
+            print(f"{variant}: no baseline, skipping")
+            continue
+        print(f"{variant}:")
+        for name, new in sorted(current[variant].items()):
+            if (old := baseline[variant].get(name)) is None:
+                print(f"  {name}: {format_time(new)} (new)")
+                continue
+            change = new / old - 1
+            threshold = args.fast_threshold if old < FAST_CUTOFF else args.threshold
+            line = f"  {name}: {format_time(old)} -> {format_time(new)} ({change:+.1%})"
+            if change > threshold:
+                line += " REGRESSION"
+                regressions.append(f"{variant} {name}")
+            print(line)
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} measurement(s) regressed by more than "
+            f"{args.threshold:.0%} (or {args.fast_threshold:.0%} for "
+            "sub-millisecond measurements):",
+            *regressions,
+            sep="\n  ",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
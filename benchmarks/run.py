@@ -0,0 +1,140 @@
+"""
+Measure the latency of runtime-introspect's own public entry points.
+
+Results are stored as JSON, keyed by interpreter variant (e.g. '3.14', '3.14t',
+'3.14+JIT'), so a single file may hold results for several interpreters.
+
+usage: python benchmarks/run.py [--output FILE] [--repeat N]
+"""
+
+import json
+import subprocess
+import sys
+import sysconfig
+import timeit
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+
+from runtime_introspect import runtime_feature_set
+from runtime_introspect._features import VALID_FEATURE_NAMES, VALID_INTROSPECTIONS
+
+Results = dict[str, float]
+
+
+def interpreter_variant() -> str:
+    variant = f"{sys.version_info[0]}.{sys.version_info[1]}"
+    if sysconfig.get_config_var("Py_GIL_DISABLED"):
+        variant += "t"
+    # sys._jit only exists in Python 3.14 and newer
+    if hasattr(sys, "_jit") and sys._jit.is_enabled():
+        variant += "+JIT"
+    return variant
+
+
+def bench_callable(stmt, *, repeat: int) -> float:
+    """Return the median time per call, in seconds."""
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    return median(t / number for t in timer.repeat(repeat=repeat, number=number))
+
+
+def bench_subprocess(args: list[str], *, repeat: int) -> float:
+    """Return the median wall time of a subprocess, in seconds."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        tstart = timeit.default_timer()
+        subprocess.run(args, check=True, capture_output=True)
+        timings.append(timeit.default_timer() - tstart)
+    return median(timings)
+
+
+def bench_import(*, repeat: int) -> float:
+    """Return the median cumulative import time of the package, in seconds."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        cp = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import runtime_introspect"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        for line in cp.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            _, cumulative, name = line.split("|")
+            if name.strip() == "runtime_introspect":
+                timings.append(int(cumulative) * 1e-6)
+                break
+        else:
+            raise RuntimeError("Failed to measure import time")
+    return median(timings)
+
+
+def run(*, repeat: int) -> Results:
+    fs = runtime_feature_set()
+    results: Results = {
+        "import": bench_import(repeat=repeat),
+        "runtime_feature_set": bench_callable(runtime_feature_set, repeat=repeat),
+        "cli": bench_subprocess(
+            [sys.executable, "-m", "runtime_introspect"], repeat=repeat
+        ),
+    }
+    for introspection in VALID_INTROSPECTIONS:
+        results[f"snapshot[all,{introspection}]"] = bench_callable(
+            lambda i=introspection: fs.snapshot(introspection=i),
+            repeat=repeat,
+        )
+        results[f"diagnostics[all,{introspection}]"] = bench_callable(
+            lambda i=introspection: fs.diagnostics(introspection=i),
+            repeat=repeat,
+        )
+        for name in VALID_FEATURE_NAMES:
+            results[f"snapshot[{name},{introspection}]"] = bench_callable(
+                lambda n=name, i=introspection: fs.snapshot(
+                    features=[n], introspection=i
+                ),
+                repeat=repeat,
+            )
+            results[f"supports[{name},{introspection}]"] = bench_callable(
+                lambda n=name, i=introspection: fs.supports(n, introspection=i),
+                repeat=repeat,
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=(
+            "JSON file to store results into. Results for other interpreter "
+            "variants are preserved. (default: print to stdout)"
+        ),
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=15,
+        help="number of repetitions per measurement (default: 15)",
+    )
+    args = parser.parse_args(argv)
+
+    variant = interpreter_variant()
+    results = run(repeat=args.repeat)
+
+    if args.output is None:
+        print(json.dumps({variant: results}, indent=2))
+        return 0
+
+    data: dict[str, Results] = {}
+    if args.output.is_file():
+        data = json.loads(args.output.read_text())
+    data[variant] = results
+    args.output.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
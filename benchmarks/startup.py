@@ -0,0 +1,126 @@
+"""
+Compare the import time and CLI latency of two source trees of runtime-introspect.
+
+These are the only measurements that are large enough (several milliseconds)
+to be compared reliably on shared machines, provided that both trees are
+measured with the same interpreter, in interleaved repetitions. Results are
+written in the same format as benchmarks/run.py, so they can be compared with
+benchmarks/compare.py.
+
+usage: python benchmarks/startup.py BASELINE_SRC CURRENT_SRC
+                                    --output-dir DIR [--repeat N]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import sysconfig
+import timeit
+from argparse import ArgumentParser
+from pathlib import Path
+from statistics import median
+
+Results = dict[str, float]
+
+
+def interpreter_variant() -> str:
+    # same as in benchmarks/run.py, which can't be imported without
+    # importing (one of) the packages under test
+    variant = f"{sys.version_info[0]}.{sys.version_info[1]}"
+    if sysconfig.get_config_var("Py_GIL_DISABLED"):
+        variant += "t"
+    # sys._jit only exists in Python 3.14 and newer
+    if hasattr(sys, "_jit") and sys._jit.is_enabled():
+        variant += "+JIT"
+    return variant
+
+
+def _env(src: Path) -> dict[str, str]:
+    # take precedence over any installed version of the package, and let
+    # bytecode be cached, as it would be in a regular installation
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    env["PYTHONPATH"] = str(src.resolve())
+    return env
+
+
+def measure_import(src: Path) -> float:
+    """Return the cumulative import time of the package, in seconds."""
+    cp = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import runtime_introspect"],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=_env(src),
+    )
+    for line in cp.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split("|")
+        if name.strip() == "runtime_introspect":
+            return int(cumulative) * 1e-6
+    raise RuntimeError("Failed to measure import time")
+
+
+def measure_cli(src: Path) -> float:
+    """Return the wall time of the CLI, in seconds."""
+    tstart = timeit.default_timer()
+    subprocess.run(
+        [sys.executable, "-m", "runtime_introspect"],
+        check=True,
+        capture_output=True,
+        env=_env(src),
+    )
+    return timeit.default_timer() - tstart
+
+
+def run(baseline: Path, current: Path, *, repeat: int) -> tuple[Results, Results]:
+    timings: dict[Path, dict[str, list[float]]] = {
+        src: {"import": [], "cli": []} for src in (baseline, current)
+    }
+    # warm up bytecode caches
+    for src in timings:
+        measure_import(src)
+
+    for i in range(repeat):
+        # alternate which tree goes first, so neither is systematically favored
+        order = (baseline, current) if i % 2 == 0 else (current, baseline)
+        for src in order:
+            timings[src]["import"].append(measure_import(src))
+            timings[src]["cli"].append(measure_cli(src))
+
+    baseline_results, current_results = (
+        {name: median(values) for name, values in timings[src].items()}
+        for src in (baseline, current)
+    )
+    return baseline_results, current_results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser()
+    parser.add_argument("baseline", type=Path, help="the baseline's src directory")
+    parser.add_argument("current", type=Path, help="the current src directory")
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        required=True,
+        help="where to write startup-baseline.json and startup-current.json",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=30,
+        help="number of interleaved repetitions per measurement (default: 30)",
+    )
+    args = parser.parse_args(argv)
+
+    variant = interpreter_variant()
+    baseline, current = run(args.baseline, args.current, repeat=args.repeat)
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    for name, results in (("baseline", baseline), ("current", current)):
+        path = args.output_dir / f"startup-{name}.json"
+        path.write_text(json.dumps({variant: results}, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Measure how throughput of concurrent feature set queries scales with threads.
+
+This is primarily intended for free-threaded interpreters (e.g. 3.14t), where
+ideal scaling is linear. On interpreters with a GIL, throughput is expected
+to stay flat.
+
+Efficiency is reported as (throughput with N threads) / (N * throughput with 1 thread).
+
+usage: python benchmarks/threads.py [--max-threads N] [--duration SECONDS]
+                                    [--output FILE]
+"""
+
+import json
+import os
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Barrier
+
+from runtime_introspect._features import VALID_INTROSPECTIONS, CPythonFeatureSet
+
+
+def measure_throughput(
+    method: str, introspection: str, *, n_threads: int, duration: float
+) -> float:
+    """Return the total number of calls per second, across all threads."""
+    fs = CPythonFeatureSet()
+    barrier = Barrier(n_threads)
+
+    def worker() -> int:
+        func = getattr(fs, method)
+        if method == "supports":
+            args: tuple[str, ...] = ("free-threading",)
+        else:
+            args = ()
+        count = 0
+        barrier.wait()
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            func(*args, introspection=introspection)
+            count += 1
+        return count
+
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        futures = [executor.submit(worker) for _ in range(n_threads)]
+        return sum(f.result() for f in futures) / duration
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--max-threads",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="maximum number of threads (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=1.0,
+        help="duration of each measurement, in seconds (default: 1)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="JSON file to store efficiencies into, by number of threads",
+    )
+    args = parser.parse_args(argv)
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{sys.version} (GIL {'enabled' if gil_enabled else 'disabled'})")
+
+    n_threads_list = sorted(
+        {1, args.max_threads}
+        | {
+            2**i
+            for i in range(args.max_threads.bit_length())
+            if 2**i < args.max_threads
+        }
+    )
+    results: dict[str, dict[int, float]] = {}
+    for method in ("snapshot", "diagnostics", "supports"):
+        for introspection in VALID_INTROSPECTIONS:
+            print(f"{method}[{introspection}]")
+            efficiencies = results[f"{method}[{introspection}]"] = {}
+            reference: float | None = None
+            for n_threads in n_threads_list:
+                throughput = measure_throughput(
+                    method,
+                    introspection,
+                    n_threads=n_threads,
+                    duration=args.duration,
+                )
+                if reference is None:
+                    reference = throughput
+                efficiency = throughput / (n_threads * reference)
+                efficiencies[n_threads] = efficiency
+                print(
+                    f"  {n_threads:>3} thread(s): {throughput:>12,.0f} calls/s "
+                    f"(efficiency: {efficiency:.0%})"
+                )
+
+    if args.output is not None:
+        data = {
+            "python": sys.version,
+            "gil_enabled": gil_enabled,
+            "cpu_count": os.cpu_count(),
+            "efficiency": results,
+        }
+        args.output.write_text(json.dumps(data, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
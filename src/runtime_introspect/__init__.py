@@ -1,7 +1,60 @@
-__all__ = ["CPythonFeatureSet", "Feature", "runtime_feature_set"]
+__all__ = [
+    "CPythonFeatureSet",
+    "Feature",
+    "MemoryFootprint",
+    "SnapshotPublisher",
+    "TraceRecorder",
+    "Transition",
+    "collect_specialization_stats",
+    "iter_published",
+    "measure_memory_footprint",
+    "read_published",
+    "runtime_feature_set",
+    "snapshot_diff",
+]
 import sys
+from typing import TYPE_CHECKING
 
-from ._features import CPythonFeatureSet, DummyFeatureSet, Feature, FeatureSet
+from ._features import (
+    CPythonFeatureSet,
+    DummyFeatureSet,
+    Feature,
+    FeatureSet,
+    Transition,
+    snapshot_diff,
+)
+
+if TYPE_CHECKING:
+    from ._memory import MemoryFootprint, measure_memory_footprint
+    from ._publish import SnapshotPublisher, iter_published, read_published
+    from ._specialization import collect_specialization_stats
+    from ._trace import TraceRecorder
+
+# these are not needed to inspect features, and depend on modules that are
+# comparatively slow to import, so they are only imported on first access
+_LAZY_EXPORTS: dict[str, str] = {
+    "MemoryFootprint": "_memory",
+    "measure_memory_footprint": "_memory",
+    "SnapshotPublisher": "_publish",
+    "iter_published": "_publish",
+    "read_published": "_publish",
+    "collect_specialization_stats": "_specialization",
+    "TraceRecorder": "_trace",
+}
+
+
+def __getattr__(name: str) -> object:
+    if (module_name := _LAZY_EXPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value: object = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
 
 def runtime_feature_set() -> FeatureSet:
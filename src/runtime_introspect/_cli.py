@@ -2,13 +2,14 @@
 # disabling strict mode for this file because argparse is
 # impossible to combine with strict type checking
 import sys
-from argparse import ArgumentParser
+from argparse import SUPPRESS, ArgumentParser
 from pprint import pprint
+from typing import Literal
 
 from runtime_introspect import runtime_feature_set
 from runtime_introspect._features import (
-    VALID_FEATURE_NAMES,
     VALID_INTROSPECTIONS,
+    CPythonFeatureSet,
     DummyFeatureSet,
 )
 
@@ -32,8 +33,15 @@ def main(argv: list[str] | None = None) -> int:
         required=False,
         default="all",
         nargs="+",
-        choices=VALID_FEATURE_NAMES + ["all"],
-        help="select specific features (default: all)",
+        # not using choices: listing plugins requires scanning entry points of
+        # all installed packages, which is only worth it if they are requested
+        metavar="FEATURE",
+        help=(
+            "select specific features, among "
+            f"{', '.join(CPythonFeatureSet._registry.builtin_names)}, all, "
+            "or features provided by plugins (default: all, which excludes "
+            "memory-footprint and plugins)"
+        ),
     )
     parser.add_argument(
         "--introspection",
@@ -48,25 +56,150 @@ def main(argv: list[str] | None = None) -> int:
         help="print feature states using internal representations",
     )
 
+    subparsers = parser.add_subparsers(dest="command")
+    ps_parser = subparsers.add_parser(
+        "ps", help="list feature states published by running processes"
+    )
+    ps_parser.add_argument(
+        "--directory",
+        required=False,
+        default=None,
+        help="where to look for published snapshots (default: /dev/shm or tmp)",
+    )
+
+    watch_parser = subparsers.add_parser(
+        "watch", help="periodically sample feature states in a running process"
+    )
+    watch_parser.add_argument(
+        "--pid", required=True, type=int, help="the process to sample"
+    )
+    watch_parser.add_argument(
+        "--interval",
+        required=False,
+        default="1s",
+        help="time between samples, e.g. '1s' or '500ms' (default: 1s)",
+    )
+    watch_parser.add_argument(
+        "--count",
+        required=False,
+        default=None,
+        type=int,
+        help="stop after this many samples (default: run until interrupted)",
+    )
+    # also accepted after the subcommand, where it can't swallow it: with the
+    # default suppressed, the top-level value is only overridden if passed here
+    watch_parser.add_argument(
+        "--features",
+        required=False,
+        default=SUPPRESS,
+        nargs="+",
+        metavar="FEATURE",
+        help="select specific features, among free-threading, JIT (default: all)",
+    )
+
     args = parser.parse_args(argv)
 
+    features: list[str] | Literal["all"]
     match args.features:
-        case ["all"]:
+        case "all" | ["all"]:
             features = "all"
         case _:
             features = args.features
+            registry = CPythonFeatureSet._registry
+            builtin_names = registry.builtin_names
+            for name in features:
+                if name in builtin_names or name in registry:
+                    continue
+                if name == "all":
+                    parser.error(
+                        "argument --features: 'all' cannot be combined with "
+                        "other features"
+                    )
+                choices = ", ".join(repr(n) for n in [*registry.names(), "all"])
+                parser.error(
+                    f"argument --features: invalid choice: {name!r} "
+                    f"(choose from {choices})"
+                )
+
+    if args.command == "ps":
+        return _ps(args.directory, debug=args.debug)
+    if args.command == "watch":
+        # subcommands' dependencies are only imported when needed,
+        # so as not to slow down the default command
+        from runtime_introspect._watch import WATCHABLE_FEATURE_NAMES, parse_interval
+
+        try:
+            interval = parse_interval(args.interval)
+        except ValueError as exc:
+            watch_parser.error(str(exc))
+        if args.introspection != "stable":
+            watch_parser.error("only stable introspection is supported")
+        if features != "all":
+            for name in features:
+                if name not in WATCHABLE_FEATURE_NAMES:
+                    watch_parser.error(
+                        f"feature {name!r} cannot be sampled remotely "
+                        f"(choose from {', '.join(WATCHABLE_FEATURE_NAMES)})"
+                    )
+        return _watch(
+            args.pid,
+            interval=interval,
+            features=features,
+            count=args.count,
+        )
 
     if args.debug:
         for ft in fs.snapshot(
-            features=features,  # type: ignore
+            features=features,
             introspection=args.introspection,
         ):
             pprint(ft)
     else:
         for diagnostic in fs.diagnostics(
-            features=features,  # type: ignore
+            features=features,
             introspection=args.introspection,
         ):
             print(diagnostic)
 
     return 0
+
+
+def _ps(directory: str | None, *, debug: bool) -> int:
+    from runtime_introspect._publish import iter_published
+
+    for pid, features in iter_published(directory):
+        print(f"pid {pid}:")
+        for ft in features:
+            if debug:
+                pprint(ft)
+            else:
+                print(f"  {ft.diagnostic}")
+    return 0
+
+
+def _watch(
+    pid: int,
+    *,
+    interval: float,
+    features: list[str] | Literal["all"],
+    count: int | None,
+) -> int:
+    from runtime_introspect._watch import remote_exec_feature, watch
+
+    ft = remote_exec_feature()
+    if not ft.status.enabled:
+        print(ft.diagnostic, file=sys.stderr)
+        return 1
+    try:
+        watch(
+            pid,
+            interval=interval,
+            features=features,
+            count=count,
+        )
+    except KeyboardInterrupt:
+        pass
+    except (OSError, RuntimeError) as exc:
+        print(f"Failed to sample process {pid}: {exc}", file=sys.stderr)
+        return 1
+    return 0
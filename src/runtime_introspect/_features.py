@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-__all__ = ["CPythonFeatureSet", "Feature"]
+__all__ = [
+    "CPythonFeatureSet",
+    "Feature",
+    "Subscription",
+    "Transition",
+    "snapshot_diff",
+]
 import os
 import sys
 import sysconfig
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, replace
 from typing import ClassVar, Final, Literal, Protocol, TypeAlias, cast
 
+from runtime_introspect._registry import FeatureRegistry
 from runtime_introspect._status import Status
 
 
@@ -30,24 +37,41 @@ VALID_INTROSPECTIONS: Final[list[Introspection]] = [
     "unstable-inspect-activity",
 ]
 
-FeatureName: TypeAlias = Literal["free-threading", "JIT"]
-VALID_FEATURE_NAMES: Final[list[FeatureName]] = ["free-threading", "JIT"]
+FeatureName: TypeAlias = Literal[
+    "free-threading", "JIT", "specialization", "memory-footprint"
+]
+VALID_FEATURE_NAMES: Final[list[FeatureName]] = [
+    "free-threading",
+    "JIT",
+    "specialization",
+]
+# features that are only inspected when requested by name,
+# because they are comparatively expensive and vary from one call to the next
+OPT_IN_FEATURE_NAMES: Final[list[FeatureName]] = ["memory-footprint"]
 
 
 class FeatureSet(Protocol):
     def snapshot(
         self,
         *,
-        features: Iterable[FeatureName] | Literal["all"] = "all",
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
         introspection: Introspection = "stable",
     ) -> list[Feature]: ...
     def diagnostics(
         self,
         *,
-        features: Iterable[FeatureName] | Literal["all"] = "all",
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
         introspection: Introspection = "stable",
     ) -> list[str]: ...
-    def supports(self, feature: FeatureName, /) -> bool | None: ...
+    def supports(self, feature: FeatureName | str, /) -> bool | None: ...
+    def subscribe(
+        self,
+        callback: Callable[[list[Transition]], object],
+        /,
+        *,
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
+        introspection: Introspection = "stable",
+    ) -> Subscription: ...
 
 
 class FeatureGetter(Protocol):
@@ -57,6 +81,111 @@ class FeatureGetter(Protocol):
     ) -> Feature: ...
 
 
+_State: TypeAlias = tuple[bool | None, bool | None, bool | None]
+
+
+def _state(st: Status) -> _State:
+    # this is all it takes to tell labels apart, and much cheaper than
+    # comparing rendered labels or summaries
+    return (st.available, st.enabled, st.active)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Transition:
+    """Represent a change in a feature's status between two snapshots.
+
+    old (resp. new) is None if the feature is absent from the old
+    (resp. new) snapshot.
+    """
+
+    name: str
+    old: Status | None
+    new: Status | None
+
+    @property
+    def diagnostic(self) -> str:
+        """A legible diagnostic."""
+        old = self.old.label if self.old is not None else "absent"
+        new = self.new.label if self.new is not None else "absent"
+        return f"{self.name}: {old} -> {new}"
+
+
+def snapshot_diff(old: Sequence[Feature], new: Sequence[Feature]) -> list[Transition]:
+    """
+    Compute per-feature transitions between two snapshots.
+
+    Features are matched by name. Only changes in status (as reflected by
+    labels) are reported, while changes in details alone are ignored.
+    Transitions are ordered as features first appear in old, then in new.
+    """
+    old_states = {ft.name: ft.status for ft in old}
+    new_states = {ft.name: ft.status for ft in new}
+    transitions: list[Transition] = []
+    for name in {**old_states, **new_states}:
+        old_st = old_states.get(name)
+        new_st = new_states.get(name)
+        if old_st is not None and new_st is not None:
+            if _state(old_st) == _state(new_st):
+                continue
+        transitions.append(Transition(name=name, old=old_st, new=new_st))
+    return transitions
+
+
+class Subscription:
+    """
+    Watch a feature set for status changes.
+
+    Use `FeatureSet.subscribe` to create instances. A reference snapshot is
+    taken at creation time; each call to `poll` takes a new snapshot, and
+    invokes the callback if (and only if) any status changed.
+    """
+
+    def __init__(
+        self,
+        fs: FeatureSet,
+        callback: Callable[[list[Transition]], object],
+        *,
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
+        introspection: Introspection = "stable",
+    ) -> None:
+        self._fs = fs
+        self._callback = callback
+        self._features = features if features == "all" else list(features)
+        self._introspection: Introspection = introspection
+        self._last = self._take_snapshot()
+        self._cancelled = False
+
+    def _take_snapshot(self) -> list[Feature]:
+        return self._fs.snapshot(
+            features=self._features,
+            introspection=self._introspection,
+        )
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def poll(self) -> list[Transition]:
+        """
+        Take a new snapshot and compare it to the previous one.
+
+        Returns the list of transitions, which is empty if nothing changed
+        or if the subscription was cancelled.
+        """
+        if self._cancelled:
+            return []
+        new = self._take_snapshot()
+        transitions = snapshot_diff(self._last, new)
+        self._last = new
+        if transitions:
+            self._callback(transitions)
+        return transitions
+
+    def cancel(self) -> None:
+        """Stop invoking the callback. Subsequent polls are no-ops."""
+        self._cancelled = True
+
+
 class CPythonFreeThreading:
     @staticmethod
     def snapshot(
@@ -137,7 +266,21 @@ class CPythonJIT:
             )
             return replace(ft, status=st)
         if sys.version_info[:2] == (3, 13):
-            st = replace(st, details="no introspection API known for Python 3.13")
+            # only needed on Python 3.13, so not imported eagerly
+            from runtime_introspect._jit import (
+                get_python_jit_envvar,
+                probe_jit_activity,
+                status_from_build,
+            )
+
+            st = status_from_build(
+                cast(str | None, sysconfig.get_config_var("CONFIG_ARGS")),
+                PYTHON_JIT=get_python_jit_envvar(),
+            )
+            if st.enabled and introspection == "unstable-inspect-activity":
+                # keep details explaining the enabled state if the probe fails
+                if (active := probe_jit_activity()) is not None:
+                    st = replace(st, active=active, details=None)
             return replace(ft, status=st)
 
         assert sys.version_info >= (3, 14)
@@ -176,6 +319,73 @@ class CPythonJIT:
         return replace(ft, status=st)
 
 
+class CPythonSpecialization:
+    @staticmethod
+    def snapshot(
+        fs: FeatureSet,  # pyright: ignore[reportUnusedParameter]
+        /,
+        *,
+        introspection: Introspection = "stable",  # pyright: ignore[reportUnusedParameter]
+    ) -> Feature:
+        st = Status(available=None, enabled=None, active=None)
+        ft = Feature(name="specialization", status=st)
+
+        if sys.version_info < (3, 11):
+            st = replace(
+                st,
+                available=False,
+                details="the specializing adaptive interpreter only exists in Python 3.11 and newer",
+            )
+            return replace(ft, status=st)
+        # same as _specialization.is_stats_build, which isn't imported here
+        # since it is comparatively slow to import
+        if not hasattr(sys, "_stats_on"):
+            if sys.version_info < (3, 12):
+                details = (
+                    "statistics collection API only exists in Python 3.12 and newer"
+                )
+            else:
+                details = "this interpreter was built without specialization statistics support"
+            st = replace(st, available=False, details=details)
+            return replace(ft, status=st)
+
+        # there is no API to inspect whether statistics are currently being collected
+        st = replace(
+            st,
+            available=True,
+            details="statistics can be collected with collect_specialization_stats",
+        )
+        return replace(ft, status=st)
+
+
+class CPythonMemoryFootprint:
+    @staticmethod
+    def snapshot(
+        fs: FeatureSet,  # pyright: ignore[reportUnusedParameter]
+        /,
+        *,
+        introspection: Introspection = "stable",  # pyright: ignore[reportUnusedParameter]
+    ) -> Feature:
+        from runtime_introspect._memory import format_size, measure_memory_footprint
+
+        # measurements are always available, so they are reported as details
+        mf = measure_memory_footprint()
+        measurements = [
+            f"object header: {format_size(mf.object_header)}",
+            f"GC pre-header: {format_size(mf.gc_header)}",
+        ]
+        if mf.rss is not None:
+            measurements.append(f"RSS: {format_size(mf.rss)}")
+        if mf.peak_rss is not None:
+            measurements.append(f"peak RSS: {format_size(mf.peak_rss)}")
+        sizes = ", ".join(
+            f"{name} {format_size(size)}" for name, size in mf.builtin_sizes.items()
+        )
+        details = f"{', '.join(measurements)}; builtin sizes: {sizes}"
+        st = Status(available=True, enabled=None, active=None, details=details)
+        return Feature(name="memory-footprint", status=st)
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class CPythonFeatureSet:
     """Represents optional CPython features.
@@ -193,12 +403,19 @@ class CPythonFeatureSet:
     _feature_getters: ClassVar[Final[dict[FeatureName, FeatureGetter]]] = {  # type: ignore[valid-type]
         "free-threading": CPythonFreeThreading,
         "JIT": CPythonJIT,
+        "specialization": CPythonSpecialization,
+    }
+    _opt_in_feature_getters: ClassVar[Final[dict[FeatureName, FeatureGetter]]] = {  # type: ignore[valid-type]
+        "memory-footprint": CPythonMemoryFootprint,
     }
+    _registry: ClassVar[Final[FeatureRegistry[FeatureGetter]]] = (  # type: ignore[valid-type]
+        FeatureRegistry(_feature_getters, opt_in=_opt_in_feature_getters)
+    )
 
     def snapshot(
         self,
         *,
-        features: Iterable[FeatureName] | Literal["all"] = "all",
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
         introspection: Introspection = "stable",
     ) -> list[Feature]:
         """
@@ -211,7 +428,9 @@ class CPythonFeatureSet:
         ----------
 
         features: 'all' (default) or list of valid feature names
-          Select features to inspect and report on.
+          Select features to inspect and report on. 'all' selects built-in
+          features, except for 'memory-footprint', which, like features
+          provided by plugins, must be requested explicitly, by name.
 
         introspection: 'stable' (default) or 'unstable-inspect-activity'
           For some features, active and inactive status can only be inspected
@@ -219,17 +438,17 @@ class CPythonFeatureSet:
           Use introspection='unstable-inspect-activity' for more accurate
           reporting if this is acceptable in your application.
         """
-        getters = self.__class__._feature_getters
+        registry = self.__class__._registry
         if features == "all":
-            features = list(getters)
+            features = registry.default_names
         return [
-            getters[ft].snapshot(self, introspection=introspection) for ft in features
+            registry[ft].snapshot(self, introspection=introspection) for ft in features
         ]
 
     def diagnostics(
         self,
         *,
-        features: Iterable[FeatureName] | Literal["all"] = "all",
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
         introspection: Introspection = "stable",
     ) -> list[str]:
         """
@@ -239,7 +458,9 @@ class CPythonFeatureSet:
         ----------
 
         features: 'all' (default) or list of valid feature names
-          Select features to inspect and report on.
+          Select features to inspect and report on. 'all' selects built-in
+          features, except for 'memory-footprint', which, like features
+          provided by plugins, must be requested explicitly, by name.
 
         introspection: 'stable' (default) or 'unstable-inspect-activity'
           For some features, active and inactive status can only be inspected
@@ -253,7 +474,7 @@ class CPythonFeatureSet:
         ]
 
     def supports(
-        self, feature: FeatureName, /, *, introspection: Introspection = "stable"
+        self, feature: FeatureName | str, /, *, introspection: Introspection = "stable"
     ) -> bool | None:
         """
         Assess availability of a specific feature, by name.
@@ -262,20 +483,53 @@ class CPythonFeatureSet:
         in which case None is returned instead.
         """
 
-        if feature not in (getters := self.__class__._feature_getters):
+        if feature not in (registry := self.__class__._registry):
             return None
 
         # this type annotation is redundant, but it helps mypy getting to the finish line
-        ft: Feature = getters[feature].snapshot(self, introspection=introspection)
+        ft: Feature = registry[feature].snapshot(self, introspection=introspection)
         return ft.status.available
 
+    def subscribe(
+        self,
+        callback: Callable[[list[Transition]], object],
+        /,
+        *,
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
+        introspection: Introspection = "stable",
+    ) -> Subscription:
+        """
+        Subscribe to status changes.
+
+        Returns a Subscription, which takes a reference snapshot immediately.
+        Each call to `Subscription.poll` then takes a new snapshot and invokes
+        callback with a list of transitions, only if any status changed.
+        Changes are detected by comparing status triplets, without rendering
+        diagnostics.
+
+        Parameters
+        ----------
+
+        callback: callable
+          Invoked with a non-empty list of Transition instances.
+
+        features: 'all' (default) or list of valid feature names
+          Select features to watch.
+
+        introspection: 'stable' (default) or 'unstable-inspect-activity'
+          See `CPythonFeatureSet.snapshot`.
+        """
+        return Subscription(
+            self, callback, features=features, introspection=introspection
+        )
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DummyFeatureSet:
     def snapshot(
         self,
         *,
-        features: Iterable[FeatureName] | Literal["all"] = "all",  # pyright: ignore[reportUnusedParameter]
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",  # pyright: ignore[reportUnusedParameter]
         introspection: Introspection = "stable",  # pyright: ignore[reportUnusedParameter]
     ) -> list[Feature]:
         return []
@@ -283,14 +537,26 @@ class DummyFeatureSet:
     def diagnostics(
         self,
         *,
-        features: Iterable[FeatureName] | Literal["all"] = "all",  # pyright: ignore[reportUnusedParameter]
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",  # pyright: ignore[reportUnusedParameter]
         introspection: Introspection = "stable",  # pyright: ignore[reportUnusedParameter]
     ) -> list[str]:
         return []
 
     def supports(
         self,
-        feature: FeatureName,  # pyright: ignore[reportUnusedParameter]
+        feature: FeatureName | str,  # pyright: ignore[reportUnusedParameter]
         /,
     ) -> bool | None:
         return None
+
+    def subscribe(
+        self,
+        callback: Callable[[list[Transition]], object],
+        /,
+        *,
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
+        introspection: Introspection = "stable",
+    ) -> Subscription:
+        return Subscription(
+            self, callback, features=features, introspection=introspection
+        )
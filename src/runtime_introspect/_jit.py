@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+__all__ = [
+    "get_python_jit_envvar",
+    "parse_experimental_jit_option",
+    "probe_jit_activity",
+    "status_from_build",
+]
+import os
+import stat
+import sys
+from dataclasses import replace
+from typing import TYPE_CHECKING, Final, Literal, TypeAlias
+
+from runtime_introspect._status import Status
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+JITOption: TypeAlias = Literal["no", "yes", "yes-off", "interpreter"]
+
+_CONFIGURE_FLAG: Final = "--enable-experimental-jit"
+
+# executors (compiled traces) are attached to hot code objects.
+# The loop is chosen to be hot enough to be optimized, yet fast to run.
+_PROBE_SCRIPT: Final = """\
+import _opcode
+
+def hot():
+    total = 0
+    for i in range(5000):
+        total += i
+    return total
+
+for _ in range(20):
+    hot()
+
+code = hot.__code__
+for offset in range(0, len(code.co_code), 2):
+    try:
+        _opcode.get_executor(code, offset)
+    except (ValueError, RuntimeError):
+        continue
+    print(1)
+    break
+else:
+    print(0)
+"""
+_PROBE_TIMEOUT: Final = 10  # seconds
+
+# racing writes (on free-threaded builds) are benign, since results are stable
+_PROBE_CACHE: dict[str, bool | None] = {}
+# CONFIG_ARGS never changes at runtime, but is parsed on every JIT snapshot.
+# A plain dict is used rather than functools.lru_cache, whose lock would
+# serialize concurrent lookups on free-threaded builds.
+_JIT_OPTION_CACHE: dict[str, JITOption | str] = {}
+
+
+def parse_experimental_jit_option(config_args: str, /) -> JITOption | str:
+    """
+    Parse the value of --enable-experimental-jit from CONFIG_ARGS.
+
+    Returns 'no' if the option was not passed to configure.
+    """
+    if (cached := _JIT_OPTION_CACHE.get(config_args)) is not None:
+        return cached
+
+    # only needed on Python 3.13, so not imported eagerly
+    import shlex
+
+    value: str = "no"
+    for arg in shlex.split(config_args):
+        if arg == _CONFIGURE_FLAG:
+            value = "yes"
+        elif arg.startswith(f"{_CONFIGURE_FLAG}="):
+            value = arg.partition("=")[2]
+        elif arg == f"--disable-{_CONFIGURE_FLAG.removeprefix('--enable-')}":
+            value = "no"
+    _JIT_OPTION_CACHE[config_args] = value
+    return value
+
+
+def get_python_jit_envvar() -> str | None:
+    """The value of PYTHON_JIT, as seen by the interpreter at startup."""
+    if sys.flags.ignore_environment:
+        return None
+    return os.getenv("PYTHON_JIT")
+
+
+def status_from_build(config_args: str | None, /, *, PYTHON_JIT: str | None) -> Status:
+    """
+    Deduce JIT status from build configuration and environment.
+
+    This is only relevant for Python 3.13, which exposes no runtime API for it,
+    and mirrors the logic applied by the interpreter at startup.
+    """
+    st = Status(available=None, enabled=None, active=None)
+    if config_args is None:
+        return replace(st, details="build configuration is unavailable")
+
+    match parse_experimental_jit_option(config_args):
+        case "no":
+            return replace(
+                st,
+                available=False,
+                details="this interpreter was built without JIT compilation support",
+            )
+        case "interpreter":
+            return replace(
+                st,
+                available=False,
+                details=(
+                    "this interpreter was built with the tier 2 interpreter "
+                    "instead of JIT compilation"
+                ),
+            )
+        case "yes" | "yes-off" as option:
+            enabled_by_default = option == "yes"
+        case option:
+            return replace(
+                st, details=f"unknown build option {_CONFIGURE_FLAG}={option}"
+            )
+
+    st = replace(st, available=True)
+    # like the interpreter, only consider the first character of PYTHON_JIT
+    if PYTHON_JIT:
+        if PYTHON_JIT.startswith("0"):
+            return replace(st, enabled=False, details="forced by envvar PYTHON_JIT=0")
+        return replace(st, enabled=True, details=f"by envvar {PYTHON_JIT=!s}")
+
+    if enabled_by_default:
+        return replace(st, enabled=True)
+    return replace(st, enabled=False, details="envvar PYTHON_JIT is unset")
+
+
+def _get_cache_dir() -> Path | None:
+    # tempfile and pathlib are comparatively slow to import, and only needed here
+    import tempfile
+    from pathlib import Path
+
+    tmpdir = Path(tempfile.gettempdir())
+    if not hasattr(os, "getuid"):  # pragma: no cover
+        # on Windows, the temporary directory is already private to each user
+        return tmpdir
+
+    # the temporary directory is typically world-writable, so results are only
+    # trusted from a private directory, which other users cannot write into.
+    # Where /dev/shm doesn't exist, published snapshots (runtime-introspect-<pid>)
+    # live in the same directory, so a distinct prefix avoids any collision
+    uid = os.getuid()
+    path = tmpdir / f"runtime-introspect-cache-{uid}"
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = path.lstat()
+    except OSError:  # pragma: no cover
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != uid or st.st_mode & 0o077:
+        return None
+    return path
+
+
+def _get_cache_path(key: str) -> Path | None:
+    import hashlib
+
+    if (cache_dir := _get_cache_dir()) is None:
+        return None
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return cache_dir / f"jit-probe-{digest}"
+
+
+def _read_cache(path: Path) -> bool | None:
+    try:
+        cached = path.read_text().strip()
+    except OSError:
+        return None
+    if cached not in ("0", "1"):
+        return None
+    return cached == "1"
+
+
+def _write_cache(path: Path, result: bool) -> None:
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except OSError:  # pragma: no cover
+        # most likely written concurrently by another process
+        return
+    with os.fdopen(fd, "w") as fh:
+        fh.write(str(int(result)))
+
+
+def probe_jit_activity() -> bool | None:
+    """
+    Check whether JIT compilation is effective with the running interpreter
+    binary and environment, by running a small benchmark in a subprocess.
+
+    Results are cached per interpreter binary (and PYTHON_JIT value), both
+    in memory and on disk (in a private directory), so the probe only runs
+    once per host and user.
+    Returns None if the probe failed.
+    """
+    executable = os.path.realpath(sys.executable)
+    PYTHON_JIT = get_python_jit_envvar()
+    try:
+        mtime = os.stat(executable).st_mtime_ns
+    except OSError:
+        return None
+    key = f"{executable}:{mtime}:{PYTHON_JIT}"
+    if key in _PROBE_CACHE:
+        return _PROBE_CACHE[key]
+
+    cache_path = _get_cache_path(key)
+    result: bool | None = None
+    if cache_path is not None:
+        result = _read_cache(cache_path)
+    if result is None:
+        result = _run_probe()
+        if result is not None and cache_path is not None:
+            _write_cache(cache_path, result)
+    _PROBE_CACHE[key] = result
+    return result
+
+
+def _run_probe() -> bool | None:
+    # subprocess is comparatively slow to import, and only needed here
+    import subprocess
+
+    try:
+        cp = subprocess.run(
+            [
+                sys.executable,
+                *(["-E"] if sys.flags.ignore_environment else []),
+                "-c",
+                _PROBE_SCRIPT,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=_PROBE_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    match cp.stdout.strip():
+        case "1":
+            return True
+        case "0":
+            return False
+        case _:
+            return None
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+__all__ = ["MemoryFootprint", "measure_memory_footprint"]
+import sys
+from dataclasses import dataclass
+from typing import Final
+
+_PROC_STATUS: Final = "/proc/self/status"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MemoryFootprint:
+    """
+    Memory usage characteristics of the running interpreter, in bytes.
+
+    object_header: the size of a bare object(), i.e., the per-object header
+    gc_header: the size of the GC pre-header, which sys.getsizeof adds for
+      objects tracked by the garbage collector (measured on a list). This is
+      not the whole overhead of GC support: on free-threaded builds, GC state
+      lives in the object header itself, so this is 0
+    builtin_sizes: sizes of representative (empty) builtin objects, by type name,
+      as reported by sys.getsizeof (headers included)
+    rss: the current resident set size of the process, if known
+    peak_rss: the peak resident set size of the process, if known
+    """
+
+    object_header: int
+    gc_header: int
+    builtin_sizes: dict[str, int]
+    rss: int | None
+    peak_rss: int | None
+
+
+def _read_proc_status() -> tuple[int | None, int | None]:
+    rss: int | None = None
+    peak_rss: int | None = None
+    try:
+        with open(_PROC_STATUS) as fh:
+            for line in fh:
+                # e.g. 'VmRSS:      9876 kB'
+                key, _, value = line.partition(":")
+                if key == "VmRSS":
+                    rss = int(value.split()[0]) * 1024
+                elif key == "VmHWM":
+                    peak_rss = int(value.split()[0]) * 1024
+    except OSError:
+        pass
+    return rss, peak_rss
+
+
+def _get_peak_rss_from_rusage() -> int | None:
+    try:
+        import resource
+    except ImportError:  # pragma: no cover (Windows)
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is expressed in bytes on macOS, and kilobytes elsewhere
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def measure_memory_footprint() -> MemoryFootprint:
+    """Measure object sizes and process memory usage."""
+    samples: list[object] = [object(), 0, 0.0, "", b"", (), [], {}, set()]
+    rss, peak_rss = _read_proc_status()
+    if peak_rss is None:
+        peak_rss = _get_peak_rss_from_rusage()
+    return MemoryFootprint(
+        object_header=sys.getsizeof(object()),
+        gc_header=sys.getsizeof([]) - [].__sizeof__(),
+        builtin_sizes={type(obj).__name__: sys.getsizeof(obj) for obj in samples},
+        rss=rss,
+        peak_rss=peak_rss,
+    )
+
+
+def format_size(size: int, /) -> str:
+    """Format a size in bytes, using binary prefixes."""
+    units = ("B", "KiB", "MiB", "GiB", "TiB")
+    value = float(size)
+    exponent = 0
+    while value >= 1024 and exponent < len(units) - 1:
+        value /= 1024
+        exponent += 1
+    if exponent == 0:
+        return f"{size} B"
+    return f"{value:.1f} {units[exponent]}"
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+__all__ = ["SnapshotPublisher", "iter_published", "read_published"]
+import mmap
+import os
+import struct
+import sys
+import weakref
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from pathlib import Path
+from typing import Final, Literal, get_args
+
+from runtime_introspect._features import (
+    CPythonFeatureSet,
+    Feature,
+    FeatureName,
+    FeatureSet,
+    Introspection,
+)
+from runtime_introspect._status import Label, Status
+
+# Layout of a published snapshot (all integers are little-endian)
+# - header: magic, layout version, record count, sequence counter, publisher pid
+# - records: one fixed-size record per feature (name, status label, details)
+# The sequence counter follows seqlock conventions: it is odd while a write
+# is in progress, and even otherwise. Readers retry until they observe the
+# same even value before and after copying the records.
+_MAGIC: Final = b"RTIS"
+_LAYOUT_VERSION: Final = 1
+_HEADER: Final = struct.Struct("<4sHHQq")
+_SEQ_OFFSET: Final = 8
+_SEQ: Final = struct.Struct("<Q")
+_NAME_SIZE: Final = 32
+_DETAILS_SIZE: Final = 192
+_RECORD: Final = struct.Struct(f"<{_NAME_SIZE}sB{_DETAILS_SIZE}s")
+_NO_DETAILS: Final = b"\xff"  # never a valid leading utf-8 byte
+
+_FILE_PREFIX: Final = "runtime-introspect-"
+_MAX_READ_ATTEMPTS: Final = 1000
+_O_NOFOLLOW: Final[int] = getattr(os, "O_NOFOLLOW", 0)
+
+_LABELS: Final[tuple[Label, ...]] = get_args(Label)
+_STATUS_BY_LABEL: Final[dict[Label, Status]] = {
+    st.label: st
+    for st in (
+        Status(available=None, enabled=None, active=None),
+        Status(available=False, enabled=None, active=None),
+        Status(available=True, enabled=None, active=None),
+        Status(available=True, enabled=False, active=None),
+        Status(available=True, enabled=True, active=None),
+        Status(available=True, enabled=True, active=False),
+        Status(available=True, enabled=True, active=True),
+    )
+}
+
+
+def default_directory() -> Path:
+    """The directory where snapshots are published unless specified otherwise."""
+    if sys.platform == "linux" and os.path.isdir("/dev/shm"):
+        return Path("/dev/shm")
+
+    # tempfile is comparatively slow to import, and not needed on Linux
+    import tempfile
+
+    return Path(tempfile.gettempdir())
+
+
+def _get_process_uid(pid: int) -> int | None:
+    # only supported where procfs is available (Linux)
+    try:
+        return os.stat(f"/proc/{pid}").st_uid
+    except OSError:
+        return None
+
+
+def _lock(fd: int) -> None:
+    # publishers hold an exclusive lock on their file for as long as they're
+    # alive, so readers can tell live snapshots from ones left behind by
+    # processes that were killed, regardless of pid namespaces and pid reuse
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover (Windows)
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _is_stale(fd: int) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover (Windows)
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    return True
+
+
+def _cleanup(mm: mmap.mmap, fd: int, path: Path, pid: int) -> None:
+    mm.close()
+    os.close(fd)
+    # a forked child must not remove its parent's file
+    if os.getpid() == pid:
+        path.unlink(missing_ok=True)
+
+
+def _encode_text(text: str, size: int) -> bytes:
+    # truncate on a valid utf-8 boundary
+    return text.encode()[:size].decode(errors="ignore").encode()
+
+
+class SnapshotPublisher:
+    """
+    Publish feature snapshots to a small, fixed-layout memory-mapped file.
+
+    The file is named runtime-introspect-<pid> and lives in /dev/shm
+    where available, or in the system's temporary directory otherwise.
+    It is updated in place, so external readers (see `read_published`)
+    never need to attach to, or otherwise interact with, the publishing process.
+    The file is removed when the publisher is closed, or at exit.
+
+    A file left behind by a process that was killed is replaced, but a file
+    with the same name that belongs to another user is never written to: an
+    OSError is raised instead.
+
+    Details longer than 192 bytes are truncated.
+
+    Parameters
+    ----------
+
+    fs: a CPythonFeatureSet instance (default: a new one)
+      The feature set to take snapshots from.
+
+    features: 'all' (default) or list of valid feature names
+      Select features to publish. This selection is fixed for the lifetime
+      of the publisher.
+
+    introspection: 'stable' (default) or 'unstable-inspect-activity'
+      See `CPythonFeatureSet.snapshot`.
+
+    directory: path-like (optional)
+      Where to create the published file.
+    """
+
+    def __init__(
+        self,
+        fs: FeatureSet | None = None,
+        *,
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
+        introspection: Introspection = "stable",
+        directory: str | os.PathLike[str] | None = None,
+    ) -> None:
+        self._fs = fs if fs is not None else CPythonFeatureSet()
+        self._features = features if features == "all" else list(features)
+        self._introspection: Introspection = introspection
+        self._last: list[Feature] | None = None
+        self._seq = 0
+
+        snapshot = self._take_snapshot()
+        self._path = Path(
+            directory if directory is not None else default_directory()
+        ) / (f"{_FILE_PREFIX}{os.getpid()}")
+        size = _HEADER.size + len(snapshot) * _RECORD.size
+        # the directory is typically shared with other users, who may have
+        # planted a file (or a symlink) with the expected name: only ever
+        # write to a file created here
+        self._path.unlink(missing_ok=True)
+        fd = os.open(
+            self._path, os.O_RDWR | os.O_CREAT | os.O_EXCL | _O_NOFOLLOW, 0o644
+        )
+        try:
+            _lock(fd)
+            os.ftruncate(fd, size)
+            mm = mmap.mmap(fd, size)
+        except BaseException:  # pragma: no cover
+            os.close(fd)
+            self._path.unlink(missing_ok=True)
+            raise
+        self._mm: mmap.mmap | None = mm
+        self._finalizer = weakref.finalize(
+            self, _cleanup, mm, fd, self._path, os.getpid()
+        )
+        _HEADER.pack_into(
+            mm, 0, _MAGIC, _LAYOUT_VERSION, len(snapshot), self._seq, os.getpid()
+        )
+        self._write(snapshot)
+
+    @property
+    def path(self) -> Path:
+        """The path to the published file."""
+        return self._path
+
+    def _take_snapshot(self) -> list[Feature]:
+        return self._fs.snapshot(
+            features=self._features,
+            introspection=self._introspection,
+        )
+
+    def _write(self, snapshot: list[Feature]) -> None:
+        mm = self._mm
+        if mm is None:
+            raise ValueError("Cannot publish to a closed SnapshotPublisher")
+        if len(snapshot) * _RECORD.size + _HEADER.size != len(mm):
+            raise RuntimeError("Feature count changed between snapshots")
+
+        self._seq += 1
+        _SEQ.pack_into(mm, _SEQ_OFFSET, self._seq)
+        for i, ft in enumerate(snapshot):
+            st = ft.status
+            _RECORD.pack_into(
+                mm,
+                _HEADER.size + i * _RECORD.size,
+                _encode_text(ft.name, _NAME_SIZE),
+                _LABELS.index(st.label),
+                _NO_DETAILS
+                if st.details is None
+                else _encode_text(st.details, _DETAILS_SIZE),
+            )
+        self._seq += 1
+        _SEQ.pack_into(mm, _SEQ_OFFSET, self._seq)
+        self._last = snapshot
+
+    def publish(self) -> bool:
+        """
+        Take a new snapshot and publish it, if it differs from the last one.
+
+        Returns True if the published file was updated, and False otherwise.
+        """
+        snapshot = self._take_snapshot()
+        if snapshot == self._last:
+            return False
+        self._write(snapshot)
+        return True
+
+    def close(self) -> None:
+        """Stop publishing and remove the published file."""
+        if self._mm is None:
+            return
+        self._mm = None
+        self._finalizer()
+
+    def __enter__(self) -> SnapshotPublisher:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def _decode_record(buffer: bytes, offset: int) -> Feature:
+    raw_name, label_code, raw_details = _RECORD.unpack_from(buffer, offset)
+    if label_code >= len(_LABELS):
+        raise ValueError(f"Invalid status label code {label_code}")
+    st = _STATUS_BY_LABEL[_LABELS[label_code]]
+    if raw_details[:1] != _NO_DETAILS:
+        details = raw_details.rstrip(b"\0").decode()
+        st = replace(st, details=details)
+    return Feature(name=raw_name.rstrip(b"\0").decode(), status=st)
+
+
+def read_published(path: str | os.PathLike[str]) -> tuple[int, list[Feature]]:
+    """
+    Read a snapshot published by a `SnapshotPublisher`.
+
+    Returns the publisher's pid and a list of features.
+    Raises ValueError if the file isn't a valid published snapshot, or, where
+    processes can be inspected (Linux), if it isn't owned by the same user
+    as the process it claims to be published by.
+    Note that processes are looked up in the reader's pid namespace.
+    """
+    with open(path, "rb") as fh:
+        return _read_published(fh.fileno(), path)
+
+
+def _read_published(fd: int, path: str | os.PathLike[str]) -> tuple[int, list[Feature]]:
+    fst = os.fstat(fd)
+    size = fst.st_size
+    if size < _HEADER.size:
+        raise ValueError(f"{path!s} is not a published snapshot")
+    with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+        magic, version, count, _seq, pid = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or version != _LAYOUT_VERSION:
+            raise ValueError(f"{path!s} is not a published snapshot")
+        if size != _HEADER.size + count * _RECORD.size:
+            raise ValueError(f"{path!s} is truncated")
+        if (uid := _get_process_uid(pid)) is not None and uid != fst.st_uid:
+            raise ValueError(f"{path!s} is not owned by the owner of process {pid}")
+
+        for _ in range(_MAX_READ_ATTEMPTS):
+            (seq_before,) = _SEQ.unpack_from(mm, _SEQ_OFFSET)
+            if seq_before % 2:
+                continue
+            payload = mm[_HEADER.size :]
+            (seq_after,) = _SEQ.unpack_from(mm, _SEQ_OFFSET)
+            if seq_before == seq_after:  # pragma: no branch
+                break
+        else:  # pragma: no cover
+            raise RuntimeError(f"Failed to obtain a consistent read from {path!s}")
+
+    return pid, [_decode_record(payload, i * _RECORD.size) for i in range(count)]
+
+
+def iter_published(
+    directory: str | os.PathLike[str] | None = None,
+) -> Iterator[tuple[int, list[Feature]]]:
+    """
+    Iterate over all snapshots currently published in a directory.
+
+    Yields (pid, features) pairs, sorted by pid. Files that cannot be read
+    are silently skipped, and so are files left behind by processes that
+    were killed (these are not removed).
+    """
+    directory = Path(directory if directory is not None else default_directory())
+    paths: list[tuple[int, Path]] = []
+    for path in directory.glob(f"{_FILE_PREFIX}*"):
+        suffix = path.name.removeprefix(_FILE_PREFIX)
+        if suffix.isdigit():
+            paths.append((int(suffix), path))
+
+    for _, path in sorted(paths):
+        try:
+            with open(path, "rb") as fh:
+                if _is_stale(fh.fileno()):
+                    continue
+                published = _read_published(fh.fileno(), path)
+        except (OSError, ValueError):
+            continue
+        yield published
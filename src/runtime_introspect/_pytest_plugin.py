@@ -0,0 +1,122 @@
+"""
+A pytest plugin, registered via the 'pytest11' entry point.
+
+- reports feature states in the session header (only once, even with pytest-xdist)
+- provides a 'requires_feature' marker, evaluated against cached results
+- with pytest-xdist, flags workers whose feature states differ from the controller's
+
+It can be disabled with '-p no:runtime_introspect'.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+import pytest
+
+from runtime_introspect import runtime_feature_set
+from runtime_introspect._features import Feature, FeatureSet
+
+# this key is shared with pytest-xdist workers, so it must be a plain string
+_WORKEROUTPUT_KEY: Final = "runtime_introspect_labels"
+
+_feature_set_key: Final = pytest.StashKey[FeatureSet]()
+_snapshot_key: Final = pytest.StashKey[list[Feature]]()
+_features_cache_key: Final = pytest.StashKey[dict[str, Feature | None]]()
+_worker_labels_key: Final = pytest.StashKey[dict[str, dict[str, str]]]()
+
+
+def _get_snapshot(config: pytest.Config) -> list[Feature]:
+    if (snapshot := config.stash.get(_snapshot_key, None)) is None:
+        snapshot = config.stash[_feature_set_key].snapshot()
+        config.stash[_snapshot_key] = snapshot
+        config.stash[_features_cache_key].update({ft.name: ft for ft in snapshot})
+    return snapshot
+
+
+def _get_feature(config: pytest.Config, name: str) -> Feature | None:
+    _get_snapshot(config)
+    cache = config.stash[_features_cache_key]
+    if name not in cache:
+        # not a built-in feature: only probe once per session
+        try:
+            snapshot = config.stash[_feature_set_key].snapshot(features=[name])
+        except KeyError:
+            snapshot = []
+        cache[name] = snapshot[0] if snapshot else None
+    return cache[name]
+
+
+def _get_labels(snapshot: list[Feature]) -> dict[str, str]:
+    return {ft.name: ft.status.label for ft in snapshot}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "requires_feature(name): skip test unless the named runtime feature "
+        "is available",
+    )
+    config.stash[_feature_set_key] = runtime_feature_set()
+    config.stash[_features_cache_key] = {}
+    config.stash[_worker_labels_key] = {}
+
+
+def pytest_report_header(config: pytest.Config) -> list[str]:
+    if not (snapshot := _get_snapshot(config)):
+        return []
+    return [
+        "Runtime optional features state (snapshot):",
+        *(f"  {ft.diagnostic}" for ft in snapshot),
+    ]
+
+
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    for marker in item.iter_markers(name="requires_feature"):
+        if len(marker.args) != 1 or marker.kwargs:
+            raise pytest.UsageError(
+                f"{item.nodeid}: requires_feature expects exactly one "
+                f"positional argument (a feature name), got {marker.args!r}"
+                + (f" and {marker.kwargs!r}" if marker.kwargs else "")
+            )
+        (name,) = marker.args
+        ft = _get_feature(item.config, name)
+        if ft is None:
+            pytest.skip(f"support for feature {name!r} cannot be determined")
+        if not ft.status.available:
+            pytest.skip(f"feature {name!r} is not available ({ft.diagnostic})")
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    workeroutput: dict[str, Any] | None = getattr(session.config, "workeroutput", None)
+    if workeroutput is None:
+        return
+    # take a fresh snapshot: states may have changed while running tests
+    # (e.g. the GIL may be re-enabled when importing extension modules)
+    snapshot = session.config.stash[_feature_set_key].snapshot()
+    workeroutput[_WORKEROUTPUT_KEY] = _get_labels(snapshot)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any, error: object) -> None:
+    labels = getattr(node, "workeroutput", {}).get(_WORKEROUTPUT_KEY)
+    if labels is not None:
+        node.config.stash[_worker_labels_key][node.gateway.id] = labels
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    config = terminalreporter.config
+    if not (worker_labels := config.stash[_worker_labels_key]):
+        return
+
+    reference = _get_labels(_get_snapshot(config))
+    lines: list[str] = []
+    for worker_id, labels in sorted(worker_labels.items()):
+        for name, label in labels.items():
+            if label != (expected := reference.get(name)):
+                lines.append(f"{worker_id}: {name}: {label} (controller: {expected})")
+
+    if lines:
+        terminalreporter.write_sep("=", "runtime feature states differ across workers")
+        for line in lines:
+            terminalreporter.write_line(line)
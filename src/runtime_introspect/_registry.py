@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+__all__ = ["ENTRY_POINT_GROUP", "FeatureRegistry"]
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Final, Generic, TypeVar, cast
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+ENTRY_POINT_GROUP: Final = "runtime_introspect.features"
+
+# this is meant to be a FeatureGetter. Using a type variable allows
+# this module not to depend on _features (which depends on it)
+_G = TypeVar("_G")
+# feature names may be narrower than str (e.g. a Literal type)
+_K = TypeVar("_K", bound=str)
+
+
+class FeatureRegistry(Generic[_G]):
+    """
+    Map feature names to FeatureGetter implementations.
+
+    Built-in getters are always available. Opt-in built-in getters are only
+    used when requested by name: like plugins, they are excluded from
+    `default_names` (i.e., from the 'all' selection), which is meant for
+    features that are cheap and deterministic to inspect.
+    Third-party getters are registered
+    as entry points in the 'runtime_introspect.features' group, for instance
+    in a pyproject.toml file
+
+        [project.entry-points."runtime_introspect.features"]
+        blas-threads = "my_package.features:BLASThreads"
+
+    Entry points are only discovered when a non-built-in name is first looked up,
+    and a plugin is only imported when its feature is first requested.
+    Built-in names cannot be overridden.
+    """
+
+    def __init__(
+        self,
+        builtins: Mapping[_K, _G],
+        *,
+        opt_in: Mapping[_K, _G] | None = None,
+        group: str = ENTRY_POINT_GROUP,
+    ) -> None:
+        self._default_names: list[str] = list(builtins)
+        self._builtins: dict[str, _G] = dict(builtins.items())
+        if opt_in is not None:
+            self._builtins.update(opt_in.items())
+        self._group = group
+        self._entry_points: dict[str, EntryPoint] | None = None
+        self._loaded: dict[str, _G] = {}
+
+    def _discover(self) -> dict[str, EntryPoint]:
+        if (entry_points := self._entry_points) is None:
+            # importlib.metadata is comparatively slow to import, and
+            # not needed at all unless plugins are requested
+            from importlib.metadata import entry_points as _entry_points
+
+            entry_points = {
+                ep.name: ep
+                for ep in _entry_points(group=self._group)
+                if ep.name not in self._builtins
+            }
+            # racing threads may discover entry points concurrently,
+            # but they will all store equivalent values
+            self._entry_points = entry_points
+        return entry_points
+
+    @property
+    def default_names(self) -> list[str]:
+        """Names of features selected by 'all', i.e., non-opt-in built-ins."""
+        return list(self._default_names)
+
+    @property
+    def builtin_names(self) -> list[str]:
+        """Names of built-in features, including opt-in ones."""
+        return list(self._builtins)
+
+    @property
+    def plugin_names(self) -> list[str]:
+        """Names of features provided by plugins. No plugin is imported."""
+        return sorted(self._discover())
+
+    def names(self) -> list[str]:
+        """Names of all known features, built-ins first. No plugin is imported."""
+        return self.builtin_names + self.plugin_names
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._builtins or name in self._discover()
+
+    def __getitem__(self, name: str) -> _G:
+        """
+        Get a FeatureGetter by name, importing it from a plugin if needed.
+
+        Raises KeyError if no such feature is known.
+        """
+        if (getter := self._builtins.get(name)) is not None:
+            return getter
+        if (getter := self._loaded.get(name)) is not None:
+            return getter
+        getter = cast(_G, self._discover()[name].load())
+        self._loaded[name] = getter
+        return getter
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+__all__ = [
+    "OpcodeStats",
+    "SpecializationStats",
+    "SpecializationStatsCollector",
+    "collect_specialization_stats",
+    "parse_specialization_stats",
+]
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# this is where CPython dumps statistics, see Python/specialize.c (3.12)
+# or Python/pystats.c (3.13+)
+_STATS_DIR: Final = "c:\\temp\\py_stats" if sys.platform == "win32" else "/tmp/py_stats"
+# dumps are named after a random 160 bit number
+_DUMP_NAME_REGEXP: Final = re.compile(r"^[0-9a-f]{40}\.txt$")
+# file systems may record modification times with a coarser clock than
+# time.time_ns, so these are compared with some tolerance
+_MTIME_TOLERANCE_NS: Final = 100_000_000
+
+# e.g. '    opcode[LOAD_ATTR].specialization.deopt : 42'
+_OPCODE_STAT_REGEXP: Final = re.compile(
+    r"^\s*opcode\[(?P<opname>\w+)\]\.(?P<stat>[\w.]+)\s*:\s*(?P<value>\d+)\s*$"
+)
+_OPCODE_STAT_FIELDS: Final[dict[str, str]] = {
+    "execution_count": "execution_count",
+    "specialization.success": "success",
+    "specialization.failure": "failure",
+    "specialization.hit": "hit",
+    "specialization.miss": "miss",
+    "specialization.deferred": "deferred",
+    "specialization.deopt": "deopt",
+}
+
+
+def is_stats_build() -> bool:
+    """Whether the interpreter was built with Py_STATS (--enable-pystats)."""
+    return hasattr(sys, "_stats_on")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OpcodeStats:
+    """Specialization counters for a single (family of) opcode(s)."""
+
+    name: str
+    execution_count: int = 0
+    success: int = 0
+    failure: int = 0
+    hit: int = 0
+    miss: int = 0
+    deferred: int = 0
+    deopt: int = 0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SpecializationStats:
+    """Structured specialization statistics, indexed by opcode name."""
+
+    opcodes: dict[str, OpcodeStats] = field(default_factory=dict)
+
+    def top_deopts(self, n: int = 5, /) -> list[OpcodeStats]:
+        """The n opcodes with the most deoptimizations, in decreasing order."""
+        candidates = [op for op in self.opcodes.values() if op.deopt]
+        return sorted(candidates, key=lambda op: op.deopt, reverse=True)[:n]
+
+    def summary(self, n: int = 5, /) -> list[str]:
+        """Legible one-line summaries of the n most deoptimizing opcodes."""
+        return [
+            f"{op.name}: {op.deopt} deopt(s), {op.hit} hit(s), {op.miss} miss(es)"
+            for op in self.top_deopts(n)
+        ]
+
+
+def parse_specialization_stats(text: str, /) -> SpecializationStats:
+    """
+    Parse per-opcode counters from the output of sys._stats_dump().
+
+    Lines that do not describe one of the supported per-opcode counters are
+    ignored.
+    """
+    counters: dict[str, dict[str, int]] = {}
+    for line in text.splitlines():
+        if (match := _OPCODE_STAT_REGEXP.match(line)) is None:
+            continue
+        if (name := _OPCODE_STAT_FIELDS.get(match["stat"])) is None:
+            continue
+        counters.setdefault(match["opname"], {})[name] = int(match["value"])
+
+    return SpecializationStats(
+        opcodes={
+            opname: OpcodeStats(name=opname, **values)
+            for opname, values in counters.items()
+        }
+    )
+
+
+class SpecializationStatsCollector:
+    """
+    Collect specialization statistics within a context.
+
+    Statistics are cleared on entry, and parsed into `stats` on exit.
+    Use `collect_specialization_stats` to create instances.
+    """
+
+    def __init__(self) -> None:
+        self.stats: SpecializationStats | None = None
+
+    def __enter__(self) -> SpecializationStatsCollector:
+        if not is_stats_build():
+            raise RuntimeError(
+                "Collecting specialization statistics requires an interpreter "
+                "built with --enable-pystats"
+            )
+        sys._stats_clear()  # type: ignore[attr-defined] # pyright: ignore
+        sys._stats_on()  # type: ignore[attr-defined] # pyright: ignore
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        sys._stats_off()  # type: ignore[attr-defined] # pyright: ignore
+        self.stats = parse_specialization_stats(_dump_stats())
+
+
+def _dump_stats() -> str:
+    # pathlib is comparatively slow to import, and only needed here
+    from pathlib import Path
+
+    # CPython writes statistics to a new, randomly named file, in a directory
+    # shared with other processes, so the only way to find it is to look for
+    # new files. Files that cannot have been written by this process during
+    # the call (or any file, if that is ambiguous) are never touched
+    stats_dir = Path(_STATS_DIR)
+    stats_dir.mkdir(parents=True, exist_ok=True)
+    before = set(stats_dir.iterdir())
+    tstart = time.time_ns() - _MTIME_TOLERANCE_NS
+    sys._stats_dump()  # type: ignore[attr-defined] # pyright: ignore
+    tstop = time.time_ns() + _MTIME_TOLERANCE_NS
+    candidates = [
+        path
+        for path in set(stats_dir.iterdir()) - before
+        if _is_own_dump(path, tstart=tstart, tstop=tstop)
+    ]
+    if len(candidates) != 1:
+        raise RuntimeError(
+            f"Failed to locate dumped specialization statistics in {stats_dir} "
+            f"(found {len(candidates)} candidate file(s), other processes may be "
+            "dumping statistics concurrently)"
+        )
+    path = candidates[0]
+    try:
+        return path.read_text()
+    finally:
+        path.unlink()
+
+
+def _is_own_dump(path: Path, *, tstart: int, tstop: int) -> bool:
+    if _DUMP_NAME_REGEXP.match(path.name) is None:
+        return False
+    try:
+        st = path.lstat()
+    except OSError:  # pragma: no cover (removed concurrently)
+        return False
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return False
+    return tstart <= st.st_mtime_ns <= tstop
+
+
+def collect_specialization_stats() -> SpecializationStatsCollector:
+    """
+    Collect specialization statistics within a context, for instance
+
+        with collect_specialization_stats() as collector:
+            ...  # some hot code
+        print("\\n".join(collector.stats.summary()))
+
+    This requires an interpreter built with --enable-pystats (see
+    `FeatureSet.supports('specialization')`), and raises RuntimeError otherwise.
+    Note that collection is process-wide, and that statistics previously
+    collected are cleared on entry.
+
+    CPython dumps statistics to a shared directory (/tmp/py_stats), under
+    a random name. The dump is identified as the only new file written by
+    the current user while dumping, so a RuntimeError is raised on exit if
+    another process (e.g., a Py_STATS interpreter exiting) dumps statistics
+    at the same time. Files from other processes are never removed.
+    """
+    return SpecializationStatsCollector()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+__all__ = ["TraceRecorder"]
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any, Final, Literal
+
+from runtime_introspect._features import (
+    CPythonFeatureSet,
+    Feature,
+    FeatureName,
+    FeatureSet,
+    Introspection,
+    Transition,
+    snapshot_diff,
+)
+
+_CATEGORY: Final = "runtime-introspect"
+_DEFAULT_BUFFER_SIZE: Final = 64 * 1024
+
+
+class TraceRecorder:
+    """
+    Record a timeline of feature states as Chrome/Perfetto trace events.
+
+    The output file uses the JSON array format, and is streamed to disk
+    through a buffered writer. A feature state instant event is emitted for each
+    feature when recording starts, and a transition instant event every time
+    a status changes (e.g., when the GIL is re-enabled, or the JIT is toggled).
+    The number of alive Python threads is recorded as a counter track, sampled
+    on each call to `sample`.
+
+    Timestamps are based on `time.monotonic_ns` (CLOCK_MONOTONIC on Linux).
+    To align them with a `perf` recording, record it with
+    `perf record -k CLOCK_MONOTONIC`, since `perf` uses its own clock by default.
+
+    Parameters
+    ----------
+
+    path: path-like
+      Where to write the trace. Existing files are overwritten.
+
+    fs: a CPythonFeatureSet instance (default: a new one)
+      The feature set to take snapshots from.
+
+    features: 'all' (default) or list of valid feature names
+      Select features to record.
+
+    introspection: 'stable' (default) or 'unstable-inspect-activity'
+      See `CPythonFeatureSet.snapshot`.
+
+    buffer_size: int (default: 64kiB)
+      The size of the write buffer, in bytes.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        fs: FeatureSet | None = None,
+        *,
+        features: Iterable[FeatureName | str] | Literal["all"] = "all",
+        introspection: Introspection = "stable",
+        buffer_size: int = _DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        self._fs = fs if fs is not None else CPythonFeatureSet()
+        self._features = features if features == "all" else list(features)
+        self._introspection: Introspection = introspection
+        self._pid = os.getpid()
+
+        self._file = open(path, "w", buffering=buffer_size)
+        self._file.write("[")
+        self._first_event = True
+        self._write_event(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self._pid,
+                "args": {"name": f"runtime-introspect (pid {self._pid})"},
+            }
+        )
+
+        self._last = self._take_snapshot()
+        ts = self._timestamp()
+        for ft in self._last:
+            self._write_event(
+                self._instant_event(
+                    f"{ft.name}: {ft.status.label}",
+                    ts=ts,
+                    args={"details": ft.status.details},
+                )
+            )
+        self._write_counters(ts=ts)
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def _take_snapshot(self) -> list[Feature]:
+        return self._fs.snapshot(
+            features=self._features,
+            introspection=self._introspection,
+        )
+
+    @staticmethod
+    def _timestamp() -> float:
+        # trace event timestamps are expressed in microseconds
+        return time.monotonic_ns() / 1000
+
+    def _instant_event(
+        self, name: str, *, ts: float, args: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "name": name,
+            "cat": _CATEGORY,
+            "ph": "i",
+            "s": "p",
+            "ts": ts,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+            "args": args,
+        }
+
+    def _write_event(self, event: dict[str, Any]) -> None:
+        if not self._first_event:
+            self._file.write(",\n")
+        self._first_event = False
+        self._file.write(json.dumps(event))
+
+    def _write_counters(self, *, ts: float) -> None:
+        self._write_event(
+            {
+                "name": "threads",
+                "cat": _CATEGORY,
+                "ph": "C",
+                "ts": ts,
+                "pid": self._pid,
+                "args": {"count": threading.active_count()},
+            }
+        )
+
+    def sample(self) -> list[Transition]:
+        """
+        Take a new snapshot and record transitions and counters.
+
+        Returns the list of transitions since the previous sample.
+        """
+        if self._file.closed:
+            raise ValueError("Cannot sample with a closed TraceRecorder")
+        new = self._take_snapshot()
+        ts = self._timestamp()
+        transitions = snapshot_diff(self._last, new)
+        for tr in transitions:
+            self._write_event(
+                self._instant_event(
+                    tr.diagnostic,
+                    ts=ts,
+                    args={
+                        "old details": tr.old.details if tr.old is not None else None,
+                        "new details": tr.new.details if tr.new is not None else None,
+                    },
+                )
+            )
+        self._write_counters(ts=ts)
+        self._last = new
+        return transitions
+
+    def close(self) -> None:
+        """Terminate the trace and close the output file."""
+        if self._file.closed:
+            return
+        self._file.write("]\n")
+        self._file.close()
+
+    def __enter__(self) -> TraceRecorder:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
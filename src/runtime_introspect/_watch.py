@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+__all__ = ["WATCHABLE_FEATURE_NAMES", "parse_interval", "remote_exec_feature", "watch"]
+import ast
+import os
+import re
+import stat
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import replace
+from pathlib import Path
+from typing import Final, Literal
+
+from runtime_introspect._features import Feature, FeatureName, snapshot_diff
+from runtime_introspect._publish import _O_NOFOLLOW, _get_process_uid
+from runtime_introspect._status import Status
+
+# only features that can be inspected without importing anything
+# in the target process are supported
+WATCHABLE_FEATURE_NAMES: Final[list[FeatureName]] = ["free-threading", "JIT"]
+
+_INTERVAL_REGEXP: Final = re.compile(
+    r"^\s*(?P<value>\d+(\.\d*)?|\.\d+)\s*(?P<unit>ms|s)?\s*$"
+)
+
+# how long to wait for the target process to run the payload before giving up
+# on a sample. The payload only runs once the target executes Python code, so
+# a process blocked in a system call may not respond immediately.
+_RESPONSE_TIMEOUT: Final = 5.0  # seconds
+_RESPONSE_POLL_INTERVAL: Final = 0.01  # seconds
+_MAX_CONSECUTIVE_MISSES: Final = 3
+# samples are tiny dict literals, anything larger is invalid
+_MAX_SAMPLE_SIZE: Final = 64 * 1024  # bytes
+_O_NONBLOCK: Final[int] = getattr(os, "O_NONBLOCK", 0)
+
+# executed in the target process, in its __main__ namespace: everything is kept
+# in a function that deletes itself, so as to leave no trace behind.
+# It only collects raw facts, with modules that are always loaded, and writes
+# them as a dict literal. Interpreting them is left to the watcher.
+# Errors are silenced, since they would otherwise be reported by the target.
+_PAYLOAD_TEMPLATE: Final = """\
+def _runtime_introspect_payload(output, tmp):
+    import os, sys
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    jit = getattr(sys, "_jit", None)
+    facts = {{
+        "abiflags": getattr(sys, "abiflags", ""),
+        "gil_enabled": is_gil_enabled() if is_gil_enabled else None,
+        "gil_xoption": sys._xoptions.get("gil"),
+        "jit_available": jit.is_available() if jit else None,
+        "jit_enabled": jit.is_enabled() if jit else None,
+    }}
+    if not sys.flags.ignore_environment:
+        facts["PYTHON_GIL"] = os.environ.get("PYTHON_GIL")
+        facts["PYTHON_JIT"] = os.environ.get("PYTHON_JIT")
+    try:
+        with open(tmp, "w") as fh:
+            fh.write(repr(facts))
+        os.replace(tmp, output)
+    except OSError:
+        pass
+try:
+    _runtime_introspect_payload({output!r}, {tmp!r})
+finally:
+    del _runtime_introspect_payload
+"""
+
+
+def parse_interval(interval: str, /) -> float:
+    """
+    Parse a sampling interval, e.g., '1s', '500ms', or '0.5' (in seconds).
+
+    Raises ValueError for invalid or non-positive intervals.
+    """
+    if (match := _INTERVAL_REGEXP.match(interval)) is None:
+        raise ValueError(
+            f"Invalid interval {interval!r}. Expected a number, "
+            "optionally followed by a unit ('s' or 'ms')"
+        )
+    value = float(match["value"])
+    if match["unit"] == "ms":
+        value /= 1000
+    if value <= 0:
+        raise ValueError(f"Invalid interval {interval!r}. Expected a positive value")
+    return value
+
+
+def remote_exec_feature() -> Feature:
+    """Inspect support for injecting code into other processes (sys.remote_exec)."""
+    st = Status(available=None, enabled=None, active=None)
+    ft = Feature(name="remote-exec", status=st)
+    if sys.version_info < (3, 14):
+        st = replace(
+            st,
+            available=False,
+            details="sys.remote_exec only exists in Python 3.14 and newer",
+        )
+        return replace(ft, status=st)
+
+    st = replace(st, available=True)
+    if not sys.is_remote_debug_enabled():  # pyright: ignore
+        st = replace(
+            st,
+            enabled=False,
+            details=(
+                "disabled by envvar PYTHON_DISABLE_REMOTE_DEBUG, "
+                "command line option -Xdisable-remote-debug, "
+                "or build option --without-remote-debug"
+            ),
+        )
+        return replace(ft, status=st)
+
+    st = replace(st, enabled=True)
+    return replace(ft, status=st)
+
+
+def _as_str(value: object) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def _free_threading_from_facts(facts: dict[str, object]) -> Feature:
+    # mirrors CPythonFreeThreading, for a process running Python 3.14+
+    st = Status(available=None, enabled=None, active=None)
+    ft = Feature(name="free-threading", status=st)
+    if "t" not in _as_str(facts.get("abiflags")):
+        st = replace(
+            st,
+            available=False,
+            details="this interpreter was built without free-threading support",
+        )
+        return replace(ft, status=st)
+
+    st = replace(st, available=True)
+    details: str | None
+    if facts.get("gil_enabled"):
+        if facts.get("gil_xoption") == "1":
+            details = "global locking is forced by command line option -Xgil=1"
+        elif facts.get("PYTHON_GIL") == "1":
+            details = "global locking is forced by envvar PYTHON_GIL=1"
+        else:
+            details = None
+        return replace(ft, status=replace(st, enabled=False, details=details))
+
+    if facts.get("gil_xoption") == "0":
+        details = "forced by command line option -Xgil=0"
+    elif facts.get("PYTHON_GIL") == "0":
+        details = "forced by envvar PYTHON_GIL=0"
+    else:
+        details = None
+    return replace(ft, status=replace(st, enabled=True, details=details))
+
+
+def _jit_from_facts(facts: dict[str, object]) -> Feature:
+    # mirrors CPythonJIT (with stable introspection), for Python 3.14+
+    st = Status(available=None, enabled=None, active=None)
+    ft = Feature(name="JIT", status=st)
+    if not facts.get("jit_available"):
+        st = replace(
+            st,
+            available=False,
+            details="this interpreter was built without JIT compilation support",
+        )
+        return replace(ft, status=st)
+
+    st = replace(st, available=True)
+    PYTHON_JIT = facts.get("PYTHON_JIT")
+    details: str | None = None
+    if not facts.get("jit_enabled"):
+        if PYTHON_JIT == "0":
+            details = "forced by envvar PYTHON_JIT=0"
+        elif PYTHON_JIT is None:
+            details = "envvar PYTHON_JIT is unset"
+        return replace(ft, status=replace(st, enabled=False, details=details))
+
+    if PYTHON_JIT not in ("0", None):
+        details = f"by envvar {PYTHON_JIT=!s}"
+    return replace(ft, status=replace(st, enabled=True, details=details))
+
+
+def _read_sample(path: Path) -> str | None:
+    # the output directory may belong to the target process, so symlinks are
+    # not followed, and only regular files are read (opening a FIFO would block)
+    fd = os.open(path, os.O_RDONLY | _O_NOFOLLOW | _O_NONBLOCK)
+    with open(fd, encoding="utf-8", errors="replace") as fh:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            return None
+        return fh.read(_MAX_SAMPLE_SIZE + 1)
+
+
+def _read_snapshot(path: Path, features: list[str]) -> list[Feature]:
+    content = _read_sample(path)
+    try:
+        if content is None or len(content) > _MAX_SAMPLE_SIZE:
+            raise ValueError
+        facts = ast.literal_eval(content)
+    except (ValueError, SyntaxError):
+        facts = None
+    if not isinstance(facts, dict):
+        raise RuntimeError(f"Invalid sample in {path}")
+    getters = {
+        "free-threading": _free_threading_from_facts,
+        "JIT": _jit_from_facts,
+    }
+    return [getters[name](facts) for name in features]
+
+
+def _remote_exec(pid: int, script: str) -> None:  # pragma: no cover
+    sys.remote_exec(pid, script)  # type: ignore[attr-defined] # pyright: ignore
+
+
+def _make_output_directory(directory: Path, pid: int) -> Path:
+    # payloads are written to the (private) directory, and samples to a separate
+    # subdirectory. When watching another user's process as root, the target
+    # must be able to read payloads and write samples: only the subdirectory is
+    # handed over to it, and the watcher never writes into it (samples are only
+    # read, without following symlinks, and removed)
+    output_dir = directory / "samples"
+    output_dir.mkdir(mode=0o700)
+    if not hasattr(os, "geteuid") or os.geteuid() != 0:
+        return output_dir
+    if (uid := _get_process_uid(pid)) is not None and uid != 0:
+        # payloads can be reached, but the directory can't be listed or modified
+        directory.chmod(0o711)
+        os.chown(output_dir, uid, -1)
+    return output_dir
+
+
+def _write_payload(path: Path, content: str) -> None:
+    # never follow or overwrite an existing file
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_NOFOLLOW, 0o644)
+    with open(fd, "w", encoding="utf-8") as fh:
+        if hasattr(os, "fchmod"):  # pragma: no branch
+            # the target may run as another user, so the umask doesn't apply
+            os.fchmod(fd, 0o644)
+        fh.write(content)
+
+
+def _sample(
+    pid: int, directory: Path, output_dir: Path, n: int, features: list[str]
+) -> list[Feature] | None:
+    # a late response to a timed-out sample must not be mistaken for
+    # a response to the current one, so every sample uses fresh file names
+    output = output_dir / f"sample-{n}"
+    payload = directory / f"payload-{n}.py"
+    _write_payload(
+        payload, _PAYLOAD_TEMPLATE.format(output=str(output), tmp=f"{output}.tmp")
+    )
+    try:
+        _remote_exec(pid, str(payload))
+    except BaseException:
+        payload.unlink()
+        raise
+
+    deadline = time.monotonic() + _RESPONSE_TIMEOUT
+    while not os.path.lexists(output):
+        if time.monotonic() > deadline:
+            # the target may still run the payload later (e.g., once it returns
+            # from a blocking system call), and would report a missing file on
+            # its stderr: timed-out payloads are kept until watching stops
+            return None
+        time.sleep(_RESPONSE_POLL_INTERVAL)
+    try:
+        return _read_snapshot(output, features)
+    finally:
+        payload.unlink()
+        output.unlink(missing_ok=True)
+
+
+def watch(
+    pid: int,
+    *,
+    interval: float,
+    features: Iterable[FeatureName | str] | Literal["all"] = "all",
+    count: int | None = None,
+) -> None:
+    """
+    Periodically sample feature states in another (running) process.
+
+    The initial state is printed in full, and only transitions afterwards.
+    Samples are taken by injecting a tiny, self-contained payload into the
+    target process with sys.remote_exec (which requires Python 3.14 for both
+    processes), so the target doesn't need to be instrumented in any way, nor
+    to have this package installed. Only features listed in
+    WATCHABLE_FEATURE_NAMES are supported, with stable introspection.
+    Sampling stops after `count` samples, or when interrupted.
+
+    Samples that the target doesn't respond to in time are reported on stderr.
+    Their payloads are kept until sampling stops: if the target only runs them
+    afterwards, it reports the missing file on its own stderr.
+    Raises RuntimeError if too many consecutive samples are missed, or
+    OSError if the target process cannot be sampled (e.g., because it exited,
+    or because of insufficient permissions).
+    """
+    # tempfile is comparatively slow to import, and only needed here
+    import tempfile
+
+    selected: list[str] = list(
+        WATCHABLE_FEATURE_NAMES if features == "all" else features
+    )
+    for name in selected:
+        if name not in WATCHABLE_FEATURE_NAMES:
+            raise ValueError(
+                f"Feature {name!r} cannot be sampled remotely. "
+                f"Expected one of {WATCHABLE_FEATURE_NAMES}"
+            )
+
+    with tempfile.TemporaryDirectory(prefix="runtime-introspect-watch-") as tmpdir:
+        directory = Path(tmpdir)
+        output_dir = _make_output_directory(directory, pid)
+
+        previous: list[Feature] | None = None
+        misses = 0
+        n = 0
+        while count is None or n < count:
+            if n:
+                time.sleep(interval)
+            n += 1
+            if (snapshot := _sample(pid, directory, output_dir, n, selected)) is None:
+                misses += 1
+                print(
+                    f"pid {pid}: no response to sample #{n} "
+                    f"within {_RESPONSE_TIMEOUT:g}s",
+                    file=sys.stderr,
+                    flush=True,
+                )
+                if misses >= _MAX_CONSECUTIVE_MISSES:
+                    raise RuntimeError(
+                        f"no response to {misses} consecutive samples. The "
+                        "process may be blocked, or unable to read from or "
+                        f"write to {directory}"
+                    )
+                continue
+
+            misses = 0
+            if previous is None:
+                print(f"pid {pid}:")
+                for ft in snapshot:
+                    print(f"  {ft.diagnostic}", flush=True)
+            else:
+                for transition in snapshot_diff(previous, snapshot):
+                    print(f"  {transition.diagnostic}", flush=True)
+            previous = snapshot
@@ -2,9 +2,23 @@ import sys
 
 import pytest
 
+from runtime_introspect._features import Feature
+
 cpython_only = pytest.mark.skipif(
     sys.implementation.name != "cpython", reason="intended as CPython-only"
 )
 not_cpython = pytest.mark.skipif(
     sys.implementation.name == "cpython", reason="behavior differs on CPython"
 )
+
+
+class FakeFeatureSet:
+    """A minimal, mutable stand-in for a FeatureSet."""
+
+    def __init__(self, features: list[Feature]) -> None:
+        self.features = features
+
+    def snapshot(self, *, features="all", introspection="stable"):
+        if features == "all":
+            return list(self.features)
+        return [ft for ft in self.features if ft.name in features]
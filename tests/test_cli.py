@@ -40,7 +40,7 @@ def test_params(features, introspection, debug_flag, capsys):
 
     match features:
         case () | ["all"]:
-            expected_line_count = 2
+            expected_line_count = len(VALID_FEATURE_NAMES)
         case _:
             for ft in features:
                 assert ft in out
@@ -0,0 +1,104 @@
+from dataclasses import replace
+
+import pytest
+
+from runtime_introspect import runtime_feature_set
+from runtime_introspect._features import (
+    DummyFeatureSet,
+    Feature,
+    Subscription,
+    Transition,
+    snapshot_diff,
+)
+from runtime_introspect._status import Status
+
+from .helpers import FakeFeatureSet
+
+ENABLED = Status(available=True, enabled=True, active=None)
+DISABLED = Status(available=True, enabled=False, active=None)
+UNAVAILABLE = Status(available=False, enabled=None, active=None)
+
+
+def test_transition_diagnostic():
+    tr = Transition(name="free-threading", old=ENABLED, new=DISABLED)
+    assert tr.diagnostic == "free-threading: enabled -> disabled"
+
+    tr = Transition(name="JIT", old=None, new=UNAVAILABLE)
+    assert tr.diagnostic == "JIT: absent -> unavailable"
+
+
+def test_snapshot_diff_identical():
+    ss = runtime_feature_set().snapshot()
+    assert snapshot_diff(ss, ss) == []
+
+
+def test_snapshot_diff():
+    old = [
+        Feature(name="free-threading", status=ENABLED),
+        Feature(name="JIT", status=UNAVAILABLE),
+        Feature(name="removed", status=UNAVAILABLE),
+    ]
+    new = [
+        Feature(name="added", status=ENABLED),
+        Feature(name="JIT", status=replace(UNAVAILABLE, details="changed details")),
+        Feature(name="free-threading", status=DISABLED),
+    ]
+    assert snapshot_diff(old, new) == [
+        Transition(name="free-threading", old=ENABLED, new=DISABLED),
+        Transition(name="removed", old=UNAVAILABLE, new=None),
+        Transition(name="added", old=None, new=ENABLED),
+    ]
+
+
+@pytest.fixture
+def fake_fs():
+    return FakeFeatureSet(
+        [
+            Feature(name="free-threading", status=ENABLED),
+            Feature(name="JIT", status=UNAVAILABLE),
+        ]
+    )
+
+
+def test_subscription(fake_fs):
+    calls: list[list[Transition]] = []
+    sub = Subscription(fake_fs, calls.append)
+    assert sub.poll() == []
+    assert calls == []
+
+    fake_fs.features[0] = Feature(name="free-threading", status=DISABLED)
+    expected = [Transition(name="free-threading", old=ENABLED, new=DISABLED)]
+    assert sub.poll() == expected
+    assert calls == [expected]
+
+    # no change since last poll
+    assert sub.poll() == []
+    assert calls == [expected]
+
+    sub.cancel()
+    assert sub.cancelled
+    fake_fs.features[0] = Feature(name="free-threading", status=ENABLED)
+    assert sub.poll() == []
+    assert calls == [expected]
+
+
+def test_subscription_features_selection(fake_fs):
+    calls: list[list[Transition]] = []
+    sub = Subscription(fake_fs, calls.append, features=["JIT"])
+    fake_fs.features[0] = Feature(name="free-threading", status=DISABLED)
+    assert sub.poll() == []
+    assert calls == []
+
+
+def test_feature_set_subscribe():
+    fs = runtime_feature_set()
+    calls: list[list[Transition]] = []
+    sub = fs.subscribe(calls.append)
+    assert isinstance(sub, Subscription)
+    assert sub.poll() == []
+    assert calls == []
+
+
+def test_dummy_feature_set_subscribe():
+    sub = DummyFeatureSet().subscribe(pytest.fail)
+    assert sub.poll() == []
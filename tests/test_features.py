@@ -17,6 +17,7 @@ from runtime_introspect._features import (
     DummyFeatureSet,
     Feature,
 )
+from runtime_introspect._jit import parse_experimental_jit_option
 from runtime_introspect._status import Status
 
 from .helpers import cpython_only, not_cpython
@@ -96,7 +97,11 @@ class TestCPythonFeatureSet:
     def test_featureset_snapshot(self, introspection):
         fs = CPythonFeatureSet()
         features = fs.snapshot(introspection=introspection)
-        assert [ft.name for ft in features] == ["free-threading", "JIT"]
+        assert [ft.name for ft in features] == [
+            "free-threading",
+            "JIT",
+            "specialization",
+        ]
 
     @pytest.mark.skipif(
         sys.version_info < (3, 13),
@@ -186,7 +191,19 @@ class TestCPythonFeatureSet:
             assert ft.status.details == expected_details
 
         if sys.version_info[:2] == (3, 13):
-            possible_jit_status = {"undetermined"}
+            config_args = sysconfig.get_config_var("CONFIG_ARGS")
+            if config_args is None:
+                possible_jit_status = {"undetermined"}
+            elif parse_experimental_jit_option(config_args) in ("yes", "yes-off"):
+                if introspection == "unstable-inspect-activity":
+                    # 'enabled' if the activity probe failed
+                    possible_jit_status = {"active", "inactive", "enabled", "disabled"}
+                elif env.JIT == "0":
+                    possible_jit_status = {"disabled"}
+                else:
+                    possible_jit_status = {"enabled", "disabled"}
+            else:
+                possible_jit_status = {"unavailable"}
         elif sys._jit.is_available():
             if introspection == "unstable-inspect-activity":
                 possible_jit_status = {"active", "inactive", "disabled"}
@@ -225,9 +242,8 @@ class TestCPythonFeatureSet:
         extra_possibilities: list[str] = []
         if sys.version_info < (3, 14):
             extra_possibilities.append(r"(undetermined)")
-        else:
-            if introspection == "unstable-inspect-activity":
-                extra_possibilities.append(r"((in)?active)")
+        if sys.version_info >= (3, 13) and introspection == "unstable-inspect-activity":
+            extra_possibilities.append(r"((in)?active)")
         expected_jit = re.compile(r"|".join(possible_status + extra_possibilities))
         assert expected_jit.search(di[features.index("JIT")]) is not None
 
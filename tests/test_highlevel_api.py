@@ -1,5 +1,9 @@
+import subprocess
 import sys
 
+import pytest
+
+import runtime_introspect
 from runtime_introspect import runtime_feature_set
 from runtime_introspect._features import CPythonFeatureSet, DummyFeatureSet
 
@@ -25,3 +29,38 @@ def test_feature_set_supports_invalid():
 def test_feature_set_supports_free_threading():
     fs = runtime_feature_set()
     assert isinstance(fs.supports("free-threading"), bool)
+
+
+def test_lazy_exports():
+    from runtime_introspect._publish import SnapshotPublisher
+
+    assert runtime_introspect.SnapshotPublisher is SnapshotPublisher
+    assert set(runtime_introspect.__all__) <= set(dir(runtime_introspect))
+    with pytest.raises(AttributeError, match="has no attribute 'missing'$"):
+        runtime_introspect.missing  # noqa: B018
+
+
+def test_import_is_lightweight():
+    # modules that are only needed for publishing, tracing or watching
+    # should not slow down imports of the package (threading isn't checked,
+    # since it is imported by the standard library on some versions)
+    cp = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; before = set(sys.modules); import runtime_introspect; "
+            "print(*sorted(set(sys.modules) - before))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = set(cp.stdout.split())
+    assert not imported & {
+        "json",
+        "mmap",
+        "pathlib",
+        "struct",
+        "subprocess",
+        "tempfile",
+    }
@@ -0,0 +1,232 @@
+import os
+import stat
+import subprocess
+import sys
+import sysconfig
+import tempfile
+
+import pytest
+
+from runtime_introspect import _jit
+from runtime_introspect._jit import (
+    parse_experimental_jit_option,
+    probe_jit_activity,
+    status_from_build,
+)
+
+
+@pytest.mark.parametrize(
+    "config_args, expected",
+    [
+        ("", "no"),
+        ("'--prefix=/usr' '--enable-shared'", "no"),
+        ("'--enable-experimental-jit'", "yes"),
+        ("'--enable-experimental-jit=yes-off' '--enable-shared'", "yes-off"),
+        ("--enable-experimental-jit=interpreter", "interpreter"),
+        ("'--enable-experimental-jit=no'", "no"),
+        ("'--enable-experimental-jit' '--disable-experimental-jit'", "no"),
+        ("'CFLAGS=-O3 --enable-experimental-jit'", "no"),
+    ],
+)
+def test_parse_experimental_jit_option(config_args, expected):
+    assert parse_experimental_jit_option(config_args) == expected
+
+
+def test_parse_experimental_jit_option_cached(monkeypatch):
+    config_args = "'--enable-experimental-jit=interpreter' '--with-pydebug'"
+    assert parse_experimental_jit_option(config_args) == "interpreter"
+
+    def split(s):
+        raise AssertionError("CONFIG_ARGS should only be parsed once")
+
+    monkeypatch.setattr("shlex.split", split)
+    assert parse_experimental_jit_option(config_args) == "interpreter"
+
+
+@pytest.mark.parametrize(
+    "config_args, PYTHON_JIT, expected_label, expected_details",
+    [
+        (None, None, "undetermined", "build configuration is unavailable"),
+        (
+            "",
+            "1",
+            "unavailable",
+            "this interpreter was built without JIT compilation support",
+        ),
+        (
+            "--enable-experimental-jit=interpreter",
+            None,
+            "unavailable",
+            "this interpreter was built with the tier 2 interpreter "
+            "instead of JIT compilation",
+        ),
+        (
+            "--enable-experimental-jit=maybe",
+            None,
+            "undetermined",
+            "unknown build option --enable-experimental-jit=maybe",
+        ),
+        ("--enable-experimental-jit", None, "enabled", None),
+        ("--enable-experimental-jit", "", "enabled", None),
+        (
+            "--enable-experimental-jit",
+            "0",
+            "disabled",
+            "forced by envvar PYTHON_JIT=0",
+        ),
+        (
+            "--enable-experimental-jit=yes-off",
+            None,
+            "disabled",
+            "envvar PYTHON_JIT is unset",
+        ),
+        (
+            "--enable-experimental-jit=yes-off",
+            "1",
+            "enabled",
+            "by envvar PYTHON_JIT=1",
+        ),
+    ],
+)
+def test_status_from_build(config_args, PYTHON_JIT, expected_label, expected_details):
+    st = status_from_build(config_args, PYTHON_JIT=PYTHON_JIT)
+    assert st.label == expected_label
+    assert st.details == expected_details
+    assert st.active is None
+
+
+class TestProbe:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        monkeypatch.setattr(_jit, "_PROBE_CACHE", {})
+        if not hasattr(os, "getuid"):
+            return tmp_path
+        return tmp_path / f"runtime-introspect-cache-{os.getuid()}"
+
+    @pytest.mark.parametrize("result", [True, False])
+    def test_cached(self, monkeypatch, cache_dir, result):
+        calls: list[None] = []
+
+        def fake_probe():
+            calls.append(None)
+            return result
+
+        monkeypatch.setattr(_jit, "_run_probe", fake_probe)
+        assert probe_jit_activity() is result
+        assert probe_jit_activity() is result
+        assert len(calls) == 1
+        (cache_file,) = cache_dir.iterdir()
+        assert cache_file.read_text() == str(int(result))
+        if hasattr(os, "getuid"):
+            assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+            assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+
+        # simulate a new process: the result is read from disk
+        monkeypatch.setattr(_jit, "_PROBE_CACHE", {})
+        assert probe_jit_activity() is result
+        assert len(calls) == 1
+
+    def test_invalid_cache_content(self, monkeypatch, cache_dir):
+        monkeypatch.setattr(_jit, "_run_probe", lambda: True)
+        assert probe_jit_activity() is True
+        (cache_file,) = cache_dir.iterdir()
+        cache_file.write_text("garbage")
+
+        monkeypatch.setattr(_jit, "_PROBE_CACHE", {})
+        monkeypatch.setattr(_jit, "_run_probe", lambda: False)
+        assert probe_jit_activity() is False
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX only")
+    def test_insecure_cache_dir_is_ignored(self, monkeypatch, cache_dir):
+        # a directory that other users can write into cannot be trusted
+        cache_dir.mkdir()
+        cache_dir.chmod(0o777)
+        (cache_dir / "spoofed").write_text("1")
+        calls: list[None] = []
+
+        def fake_probe():
+            calls.append(None)
+            return False
+
+        monkeypatch.setattr(_jit, "_run_probe", fake_probe)
+        assert probe_jit_activity() is False
+        monkeypatch.setattr(_jit, "_PROBE_CACHE", {})
+        assert probe_jit_activity() is False
+        assert len(calls) == 2
+        assert [p.name for p in cache_dir.iterdir()] == ["spoofed"]
+
+    def test_failure_not_cached_on_disk(self, monkeypatch, cache_dir):
+        monkeypatch.setattr(_jit, "_run_probe", lambda: None)
+        assert probe_jit_activity() is None
+        assert not cache_dir.exists() or list(cache_dir.iterdir()) == []
+
+    def test_key_depends_on_envvar(self, monkeypatch, cache_dir):
+        monkeypatch.setattr(_jit, "_run_probe", lambda: False)
+        monkeypatch.setenv("PYTHON_JIT", "0")
+        probe_jit_activity()
+        monkeypatch.setenv("PYTHON_JIT", "1")
+        probe_jit_activity()
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_missing_executable(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(sys, "executable", str(tmp_path / "missing"))
+        assert probe_jit_activity() is None
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 13), reason="_opcode.get_executor is new in 3.13"
+    )
+    def test_run_probe(self):
+        assert _jit._run_probe() in (True, False)
+
+    @pytest.mark.parametrize(
+        "outcome",
+        [
+            OSError("cannot execute"),
+            subprocess.TimeoutExpired(cmd="python", timeout=1),
+            subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr=""),
+        ],
+        ids=["oserror", "timeout", "crash"],
+    )
+    def test_run_probe_failure(self, monkeypatch, outcome):
+        def fake_run(*args, **kwargs):
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        assert _jit._run_probe() is None
+
+
+@pytest.mark.skipif(
+    sys.version_info[:2] != (3, 13), reason="build configuration is only used on 3.13"
+)
+@pytest.mark.parametrize(
+    "probe_result, expected_label, expected_details",
+    [
+        (True, "active", None),
+        (False, "inactive", None),
+        (None, "enabled", "by envvar PYTHON_JIT=1"),
+    ],
+)
+def test_featureset_w_probe(
+    monkeypatch, probe_result, expected_label, expected_details
+):
+    from runtime_introspect._features import CPythonFeatureSet
+
+    get_config_var = sysconfig.get_config_var
+
+    def fake_get_config_var(name):
+        if name == "CONFIG_ARGS":
+            return "'--enable-experimental-jit=yes-off'"
+        return get_config_var(name)
+
+    monkeypatch.setattr(sysconfig, "get_config_var", fake_get_config_var)
+    monkeypatch.setenv("PYTHON_JIT", "1")
+    monkeypatch.setattr(
+        "runtime_introspect._jit.probe_jit_activity", lambda: probe_result
+    )
+    fs = CPythonFeatureSet()
+    (ft,) = fs.snapshot(features=["JIT"], introspection="unstable-inspect-activity")
+    assert ft.status.label == expected_label
+    assert ft.status.details == expected_details
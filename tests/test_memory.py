@@ -0,0 +1,82 @@
+import re
+import sys
+
+import pytest
+
+from runtime_introspect._features import CPythonFeatureSet
+from runtime_introspect._memory import format_size, measure_memory_footprint
+
+from .helpers import cpython_only
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (0, "0 B"),
+        (1023, "1023 B"),
+        (1024, "1.0 KiB"),
+        (1536, "1.5 KiB"),
+        (5 * 1024**2, "5.0 MiB"),
+        (3 * 1024**3, "3.0 GiB"),
+        (2048 * 1024**4, "2048.0 TiB"),
+    ],
+)
+def test_format_size(size, expected):
+    assert format_size(size) == expected
+
+
+def test_measure():
+    mf = measure_memory_footprint()
+    assert mf.object_header == sys.getsizeof(object())
+    assert mf.gc_header >= 0
+    assert mf.builtin_sizes["object"] == mf.object_header
+    assert set(mf.builtin_sizes) == {
+        "object",
+        "int",
+        "float",
+        "str",
+        "bytes",
+        "tuple",
+        "list",
+        "dict",
+        "set",
+    }
+    if sys.platform == "linux":
+        assert mf.rss is not None
+        assert mf.peak_rss is not None
+        assert 0 < mf.rss <= mf.peak_rss
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="resource is not available")
+def test_measure_without_proc(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        "runtime_introspect._memory._PROC_STATUS", str(tmp_path / "missing")
+    )
+    mf = measure_memory_footprint()
+    assert mf.rss is None
+    assert mf.peak_rss is not None
+    assert mf.peak_rss > 0
+
+
+@cpython_only
+def test_feature_status():
+    fs = CPythonFeatureSet()
+    (di,) = fs.diagnostics(features=["memory-footprint"])
+    assert re.match(
+        r"^memory-footprint: available \(object header: \d+ B, GC pre-header: \d+ B",
+        di,
+    )
+    if sys.platform == "linux":
+        assert ", RSS: " in di
+        assert ", peak RSS: " in di
+    # sizes of builtin objects are included, to compare builds at a glance
+    mf = measure_memory_footprint()
+    assert re.search(r"; builtin sizes: object \d+ B, int \d+ B, .*, set \d+ B\)$", di)
+    assert f"object {format_size(mf.builtin_sizes['object'])}" in di
+
+
+@cpython_only
+def test_feature_is_opt_in():
+    fs = CPythonFeatureSet()
+    assert "memory-footprint" not in [ft.name for ft in fs.snapshot()]
+    assert fs.supports("memory-footprint") is True
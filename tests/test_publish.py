@@ -0,0 +1,215 @@
+import os
+import shutil
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from runtime_introspect import _publish
+from runtime_introspect._cli import main
+from runtime_introspect._features import Feature
+from runtime_introspect._publish import (
+    _HEADER,
+    _NAME_SIZE,
+    _SEQ,
+    _SEQ_OFFSET,
+    SnapshotPublisher,
+    _get_process_uid,
+    iter_published,
+    read_published,
+)
+from runtime_introspect._status import Status
+
+from .helpers import FakeFeatureSet, cpython_only
+
+
+@pytest.fixture
+def fake_fs():
+    return FakeFeatureSet(
+        [
+            Feature(
+                name="free-threading",
+                status=Status(available=True, enabled=True, active=None),
+            ),
+            Feature(
+                name="JIT",
+                status=Status(
+                    available=False,
+                    enabled=None,
+                    active=None,
+                    details="this interpreter was built without JIT compilation support",
+                ),
+            ),
+        ]
+    )
+
+
+def test_roundtrip(tmp_path, fake_fs):
+    with SnapshotPublisher(fake_fs, directory=tmp_path) as pub:
+        assert pub.path == tmp_path / f"runtime-introspect-{os.getpid()}"
+        pid, features = read_published(pub.path)
+        assert pid == os.getpid()
+        assert features == fake_fs.features
+    assert not pub.path.exists()
+
+
+def test_publish_on_change(tmp_path, fake_fs):
+    with SnapshotPublisher(fake_fs, directory=tmp_path) as pub:
+        assert not pub.publish()
+
+        ft = fake_fs.features[0]
+        fake_fs.features[0] = replace(
+            ft,
+            status=Status(
+                available=True,
+                enabled=False,
+                active=None,
+                details="global locking is forced by envvar PYTHON_GIL=1",
+            ),
+        )
+        assert pub.publish()
+        _, features = read_published(pub.path)
+        assert features == fake_fs.features
+
+
+def test_long_details_truncation(tmp_path, fake_fs):
+    ft = fake_fs.features[1]
+    fake_fs.features[1] = replace(ft, status=replace(ft.status, details="é" * 1000))
+    with SnapshotPublisher(fake_fs, directory=tmp_path) as pub:
+        _, features = read_published(pub.path)
+    assert features[1].status.details == "é" * 96
+
+
+def test_publish_after_close(tmp_path, fake_fs):
+    pub = SnapshotPublisher(fake_fs, directory=tmp_path)
+    pub.close()
+    pub.close()
+    fake_fs.features.pop()
+    with pytest.raises(
+        ValueError, match="^Cannot publish to a closed SnapshotPublisher$"
+    ):
+        pub.publish()
+
+
+def test_read_invalid(tmp_path):
+    path = tmp_path / "runtime-introspect-1"
+    path.write_bytes(b"not a snapshot, but long enough")
+    with pytest.raises(ValueError, match="is not a published snapshot$"):
+        read_published(path)
+
+
+def test_read_too_short(tmp_path):
+    path = tmp_path / "runtime-introspect-1"
+    path.write_bytes(b"garbage")
+    with pytest.raises(ValueError, match="is not a published snapshot$"):
+        read_published(path)
+
+
+def test_read_truncated(tmp_path, fake_fs):
+    path = tmp_path / "snapshot"
+    with SnapshotPublisher(fake_fs, directory=tmp_path) as pub:
+        path.write_bytes(pub.path.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="is truncated$"):
+        read_published(path)
+
+
+def test_read_invalid_label(tmp_path, fake_fs):
+    path = tmp_path / "snapshot"
+    with SnapshotPublisher(fake_fs, directory=tmp_path) as pub:
+        data = bytearray(pub.path.read_bytes())
+    # the label code immediately follows the name of the first record
+    data[_HEADER.size + _NAME_SIZE] = 255
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match="^Invalid status label code 255$"):
+        read_published(path)
+
+
+def test_read_inconsistent(tmp_path, fake_fs):
+    path = tmp_path / "snapshot"
+    with SnapshotPublisher(fake_fs, directory=tmp_path) as pub:
+        data = bytearray(pub.path.read_bytes())
+    # simulate a publisher that died while writing
+    _SEQ.pack_into(data, _SEQ_OFFSET, 1)
+    path.write_bytes(data)
+    with pytest.raises(RuntimeError, match="^Failed to obtain a consistent read"):
+        read_published(path)
+
+
+def test_iter_published(tmp_path, fake_fs):
+    (tmp_path / "runtime-introspect-1").write_bytes(b"garbage")
+    (tmp_path / "runtime-introspect-unrelated").write_bytes(b"garbage")
+    with SnapshotPublisher(fake_fs, directory=tmp_path):
+        assert list(iter_published(tmp_path)) == [(os.getpid(), fake_fs.features)]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="staleness is not checked")
+def test_iter_published_stale(tmp_path, fake_fs):
+    # a file left behind by a killed process (whose pid may have been reused)
+    stale = tmp_path / "runtime-introspect-1"
+    with SnapshotPublisher(fake_fs, directory=tmp_path) as pub:
+        shutil.copy(pub.path, stale)
+        assert list(iter_published(tmp_path)) == [(os.getpid(), fake_fs.features)]
+    # readers never remove files
+    assert stale.exists()
+
+
+def test_replace_stale_file(tmp_path, fake_fs):
+    target = tmp_path / "target"
+    target.write_bytes(b"precious")
+    path = tmp_path / f"runtime-introspect-{os.getpid()}"
+    path.symlink_to(target)
+    with SnapshotPublisher(fake_fs, directory=tmp_path) as pub:
+        assert not pub.path.is_symlink()
+        _, features = read_published(pub.path)
+        assert features == fake_fs.features
+    assert target.read_bytes() == b"precious"
+
+
+def test_cleanup_on_collection(tmp_path, fake_fs):
+    pub = SnapshotPublisher(fake_fs, directory=tmp_path)
+    assert pub.path.exists()
+    del pub
+    assert not list(tmp_path.iterdir())
+
+
+def test_no_cleanup_in_forked_child(tmp_path, fake_fs, monkeypatch):
+    pub = SnapshotPublisher(fake_fs, directory=tmp_path)
+    pid = os.getpid()
+    monkeypatch.setattr(_publish.os, "getpid", lambda: pid + 1)
+    pub.close()
+    assert pub.path.exists()
+
+
+def test_read_wrong_owner(tmp_path, fake_fs, monkeypatch):
+    with SnapshotPublisher(fake_fs, directory=tmp_path) as pub:
+        uid = pub.path.stat().st_uid
+        monkeypatch.setattr(_publish, "_get_process_uid", lambda pid: uid + 1)
+        with pytest.raises(ValueError, match="is not owned by the owner of process"):
+            read_published(pub.path)
+        assert list(iter_published(tmp_path)) == []
+
+
+def test_get_process_uid():
+    if Path("/proc").is_dir():
+        assert _get_process_uid(os.getpid()) == os.getuid()
+    assert _get_process_uid(-1) is None
+
+
+@cpython_only
+@pytest.mark.parametrize("debug_flag", [True, False])
+def test_cli_ps(tmp_path, debug_flag, capsys):
+    args = ["ps", "--directory", str(tmp_path)]
+    if debug_flag:
+        args.insert(0, "--debug")
+    with SnapshotPublisher(directory=tmp_path):
+        ret = main(args)
+    assert ret == 0
+
+    out, err = capsys.readouterr()
+    assert not err
+    lines = out.splitlines()
+    assert lines[0] == f"pid {os.getpid()}:"
+    if not debug_flag:
+        assert lines[1].startswith("  free-threading: ")
+        assert lines[2].startswith("  JIT: ")
@@ -0,0 +1,165 @@
+import subprocess
+import sys
+from importlib.metadata import entry_points
+from types import SimpleNamespace
+
+import pytest
+
+from runtime_introspect import _pytest_plugin, runtime_feature_set
+from runtime_introspect._pytest_plugin import pytest_testnodedown
+
+from .helpers import cpython_only
+
+# the plugin is only loaded automatically if this package is installed
+if entry_points(group="pytest11", name="runtime_introspect"):
+    PLUGINS: list[object] = []
+    PLUGIN_ARGS: list[str] = []
+else:
+    PLUGINS = [_pytest_plugin]
+    PLUGIN_ARGS = ["-p", "runtime_introspect._pytest_plugin"]
+
+
+def test_header(pytester):
+    pytester.makepyfile("def test_pass(): pass")
+    result = pytester.runpytest(plugins=PLUGINS)
+    result.assert_outcomes(passed=1)
+
+    diagnostics = runtime_feature_set().diagnostics()
+    if diagnostics:
+        result.stdout.fnmatch_lines(
+            [
+                "Runtime optional features state (snapshot):",
+                *(f"  {diagnostic}" for diagnostic in diagnostics),
+            ]
+        )
+    else:
+        result.stdout.no_fnmatch_line("Runtime optional features state*")
+
+
+def test_disabled(pytester):
+    pytester.makepyfile("def test_pass(): pass")
+    result = pytester.runpytest("-p", "no:runtime_introspect")
+    result.assert_outcomes(passed=1)
+    result.stdout.no_fnmatch_line("Runtime optional features state*")
+
+
+@cpython_only
+def test_requires_feature_marker(pytester):
+    fs = runtime_feature_set()
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.requires_feature("free-threading")
+        def test_free_threading(): pass
+
+        @pytest.mark.requires_feature("JIT")
+        def test_jit(): pass
+
+        @pytest.mark.requires_feature("invalid-feature-name")
+        def test_invalid(): pass
+        """
+    )
+    result = pytester.runpytest("-rs", "--strict-markers", plugins=PLUGINS)
+    expected_passed = [fs.supports("free-threading"), fs.supports("JIT")].count(True)
+    result.assert_outcomes(passed=expected_passed, skipped=3 - expected_passed)
+    result.stdout.fnmatch_lines(
+        ["*support for feature 'invalid-feature-name' cannot be determined"]
+    )
+    if not fs.supports("JIT"):
+        result.stdout.fnmatch_lines(["*feature 'JIT' is not available (JIT: *)"])
+
+
+@pytest.mark.parametrize(
+    "marker_args, expected",
+    [
+        ("", "got ()"),
+        ('"JIT", "free-threading"', "got ('JIT', 'free-threading')"),
+        ('name="JIT"', "got () and {'name': 'JIT'}"),
+    ],
+)
+def test_requires_feature_marker_invalid_args(pytester, marker_args, expected):
+    pytester.makepyfile(
+        f"""
+        import pytest
+
+        @pytest.mark.requires_feature({marker_args})
+        def test_invalid(): pass
+        """
+    )
+    result = pytester.runpytest(plugins=PLUGINS)
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*UsageError: test_requires_feature_marker_invalid_args.py::test_invalid: "
+            "requires_feature expects exactly one positional argument "
+            f"(a feature name), {expected}"
+        ]
+    )
+
+
+@cpython_only
+def test_worker_mismatch(pytester):
+    # simulate pytest-xdist reporting from a worker whose state differs
+    pytester.makeconftest(
+        """
+        from types import SimpleNamespace
+
+        from runtime_introspect._pytest_plugin import pytest_testnodedown
+
+
+        def pytest_sessionfinish(session):
+            node = SimpleNamespace(
+                config=session.config,
+                gateway=SimpleNamespace(id="gw0"),
+                workeroutput={
+                    "runtime_introspect_labels": {"free-threading": "mismatch"}
+                },
+            )
+            pytest_testnodedown(node, None)
+        """
+    )
+    pytester.makepyfile("def test_pass(): pass")
+    result = pytester.runpytest(plugins=PLUGINS)
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*= runtime feature states differ across workers =*",
+            "gw0: free-threading: mismatch (controller: *)",
+        ]
+    )
+
+
+def test_testnodedown_without_output():
+    node = SimpleNamespace(config=None, gateway=SimpleNamespace(id="gw0"))
+    # should be a no-op
+    pytest_testnodedown(node, None)
+
+
+@cpython_only
+def test_xdist(pytester):
+    pytest.importorskip("xdist")
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.parametrize("i", range(4))
+        def test_pass(i): pass
+        """
+    )
+    result = pytester.runpytest_subprocess(*PLUGIN_ARGS, "-n", "2")
+    result.assert_outcomes(passed=4)
+    assert result.stdout.str().count("Runtime optional features state") == 1
+    result.stdout.no_fnmatch_line("*runtime feature states differ*")
+
+
+def test_pytest_is_not_imported_by_package():
+    # pytest is not a dependency
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, runtime_introspect; assert 'pytest' not in sys.modules",
+        ],
+        check=True,
+    )
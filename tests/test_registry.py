@@ -0,0 +1,157 @@
+import sys
+from textwrap import dedent
+
+import pytest
+
+from runtime_introspect._cli import main
+from runtime_introspect._features import (
+    OPT_IN_FEATURE_NAMES,
+    VALID_FEATURE_NAMES,
+    CPythonFeatureSet,
+    CPythonFreeThreading,
+    CPythonJIT,
+)
+from runtime_introspect._registry import FeatureRegistry
+
+from .helpers import cpython_only
+
+PLUGIN_MODULE = "runtime_introspect_fake_plugin"
+
+
+@pytest.fixture
+def fake_plugin(tmp_path, monkeypatch):
+    (tmp_path / f"{PLUGIN_MODULE}.py").write_text(
+        dedent("""
+        from runtime_introspect._features import Feature
+        from runtime_introspect._status import Status
+
+
+        class FakeGetter:
+            @staticmethod
+            def snapshot(fs, /, *, introspection="stable"):
+                st = Status(available=True, enabled=None, active=None, details="fake")
+                return Feature(name="fake-feature", status=st)
+        """)
+    )
+    dist_info = tmp_path / "runtime_introspect_fake_plugin-0.1.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: runtime-introspect-fake-plugin\nVersion: 0.1\n"
+    )
+    (dist_info / "entry_points.txt").write_text(
+        dedent(f"""
+        [runtime_introspect.features]
+        fake-feature = {PLUGIN_MODULE}:FakeGetter
+        free-threading = {PLUGIN_MODULE}:FakeGetter
+        """)
+    )
+    monkeypatch.syspath_prepend(tmp_path)
+    monkeypatch.delitem(sys.modules, PLUGIN_MODULE, raising=False)
+    yield
+    sys.modules.pop(PLUGIN_MODULE, None)
+
+
+@pytest.fixture
+def registry(fake_plugin, monkeypatch):
+    registry = FeatureRegistry(
+        CPythonFeatureSet._feature_getters,
+        opt_in=CPythonFeatureSet._opt_in_feature_getters,
+    )
+    monkeypatch.setattr(CPythonFeatureSet, "_registry", registry)
+    return registry
+
+
+def test_builtins_only():
+    registry = FeatureRegistry({"free-threading": CPythonFreeThreading})
+    assert registry.builtin_names == ["free-threading"]
+    assert registry.default_names == ["free-threading"]
+    assert "free-threading" in registry
+    assert registry["free-threading"] is CPythonFreeThreading
+    with pytest.raises(KeyError):
+        registry["invalid-feature-name"]
+
+
+def test_opt_in_builtins():
+    registry = FeatureRegistry(
+        {"free-threading": CPythonFreeThreading},
+        opt_in={"JIT": CPythonJIT},
+    )
+    assert registry.default_names == ["free-threading"]
+    assert registry.builtin_names == ["free-threading", "JIT"]
+    assert registry["JIT"] is CPythonJIT
+
+
+def test_discovery_is_lazy(registry):
+    assert registry.names() == [
+        *VALID_FEATURE_NAMES,
+        *OPT_IN_FEATURE_NAMES,
+        "fake-feature",
+    ]
+    assert registry.plugin_names == ["fake-feature"]
+    assert "fake-feature" in registry
+    assert PLUGIN_MODULE not in sys.modules
+
+    getter = registry["fake-feature"]
+    assert PLUGIN_MODULE in sys.modules
+    assert registry["fake-feature"] is getter
+
+
+def test_builtins_cannot_be_overridden(registry):
+    assert registry["free-threading"] is CPythonFreeThreading
+
+
+@cpython_only
+def test_featureset_plugin(registry):
+    fs = CPythonFeatureSet()
+    assert [ft.name for ft in fs.snapshot()] == VALID_FEATURE_NAMES
+    assert PLUGIN_MODULE not in sys.modules
+
+    assert fs.supports("fake-feature") is True
+    assert fs.diagnostics(features=["fake-feature"]) == [
+        "fake-feature: available (fake)"
+    ]
+
+
+@cpython_only
+def test_cli_plugin(registry, capsys):
+    ret = main(["--features", "fake-feature"])
+    assert ret == 0
+
+    out, err = capsys.readouterr()
+    assert not err
+    assert out == "fake-feature: available (fake)\n"
+
+
+@cpython_only
+@pytest.mark.parametrize("args", [[], ["--features", "JIT"], ["ps"]])
+def test_cli_no_discovery(monkeypatch, args, tmp_path, capsys):
+    def fail(self):
+        raise AssertionError("entry points should not be discovered")
+
+    monkeypatch.setattr(FeatureRegistry, "_discover", fail)
+    if args == ["ps"]:
+        args = ["ps", "--directory", str(tmp_path)]
+    assert main(args) == 0
+
+
+@cpython_only
+@pytest.mark.parametrize(
+    "features, expected_error",
+    [
+        (
+            ["unknown-feature"],
+            "argument --features: invalid choice: 'unknown-feature' "
+            "(choose from 'free-threading', 'JIT', 'specialization', "
+            "'memory-footprint', 'fake-feature', 'all')",
+        ),
+        (
+            ["JIT", "all"],
+            "argument --features: 'all' cannot be combined with other features",
+        ),
+    ],
+)
+def test_cli_invalid_features(registry, capsys, features, expected_error):
+    with pytest.raises(SystemExit):
+        main(["--features", *features])
+    _, err = capsys.readouterr()
+    assert err.endswith(f"error: {expected_error}\n")
@@ -0,0 +1,187 @@
+import os
+import sys
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+from runtime_introspect._features import CPythonFeatureSet
+from runtime_introspect._specialization import (
+    OpcodeStats,
+    collect_specialization_stats,
+    is_stats_build,
+    parse_specialization_stats,
+)
+
+from .helpers import cpython_only
+
+STATS_DUMP = dedent("""\
+    opcode[LOAD_ATTR].specializable : 1
+        opcode[LOAD_ATTR].specialization.success : 12
+        opcode[LOAD_ATTR].specialization.failure : 3
+        opcode[LOAD_ATTR].specialization.hit : 4500
+        opcode[LOAD_ATTR].specialization.miss : 20
+        opcode[LOAD_ATTR].specialization.deopt : 7
+        opcode[LOAD_ATTR].execution_count : 5000
+        opcode[LOAD_ATTR].specialization.failure_kinds[2] : 3
+    opcode[LOAD_ATTR].pair_count[STORE_FAST] : 99
+    opcode[BINARY_OP].specializable : 1
+        opcode[BINARY_OP].specialization.hit : 800
+        opcode[BINARY_OP].specialization.deopt : 30
+    opcode[NOP].execution_count : 10
+    Calls to PyEval_EvalDefault: 1
+    """)
+
+
+def test_parse():
+    stats = parse_specialization_stats(STATS_DUMP)
+    assert stats.opcodes == {
+        "LOAD_ATTR": OpcodeStats(
+            name="LOAD_ATTR",
+            execution_count=5000,
+            success=12,
+            failure=3,
+            hit=4500,
+            miss=20,
+            deopt=7,
+        ),
+        "BINARY_OP": OpcodeStats(name="BINARY_OP", hit=800, deopt=30),
+        "NOP": OpcodeStats(name="NOP", execution_count=10),
+    }
+
+
+def test_top_deopts():
+    stats = parse_specialization_stats(STATS_DUMP)
+    assert [op.name for op in stats.top_deopts()] == ["BINARY_OP", "LOAD_ATTR"]
+    assert [op.name for op in stats.top_deopts(1)] == ["BINARY_OP"]
+    assert stats.summary() == [
+        "BINARY_OP: 30 deopt(s), 800 hit(s), 0 miss(es)",
+        "LOAD_ATTR: 7 deopt(s), 4500 hit(s), 20 miss(es)",
+    ]
+
+
+DUMP_NAME = f"{'0123456789abcdef' * 2}01234567.txt"
+
+
+@pytest.fixture
+def fake_stats_build(tmp_path, monkeypatch):
+    calls: list[str] = []
+
+    stats_dir = tmp_path / "py_stats"
+
+    def dump():
+        calls.append("dump")
+        (stats_dir / DUMP_NAME).write_text(STATS_DUMP)
+
+    monkeypatch.setattr("runtime_introspect._specialization._STATS_DIR", stats_dir)
+    for name in ("clear", "on", "off"):
+        monkeypatch.setattr(
+            sys, f"_stats_{name}", lambda name=name: calls.append(name), raising=False
+        )
+    monkeypatch.setattr(sys, "_stats_dump", dump, raising=False)
+    return calls
+
+
+def test_collect(tmp_path, fake_stats_build):
+    with collect_specialization_stats() as collector:
+        assert collector.stats is None
+        assert fake_stats_build == ["clear", "on"]
+    assert fake_stats_build == ["clear", "on", "off", "dump"]
+    assert collector.stats == parse_specialization_stats(STATS_DUMP)
+    assert list((tmp_path / "py_stats").iterdir()) == []
+
+
+def test_collect_missing_dump(monkeypatch, fake_stats_build):
+    # simulate CPython failing to write to the stats directory
+    monkeypatch.setattr(sys, "_stats_dump", lambda: None)
+    with pytest.raises(
+        RuntimeError, match="^Failed to locate dumped specialization statistics in "
+    ):
+        with collect_specialization_stats():
+            pass
+
+
+def test_collect_concurrent_dumps(tmp_path, monkeypatch, fake_stats_build):
+    stats_dir = tmp_path / "py_stats"
+    other = stats_dir / f"{'f' * 40}.txt"
+
+    def dump():
+        # another process dumps its statistics at the same time
+        other.write_text(STATS_DUMP)
+        (stats_dir / DUMP_NAME).write_text(STATS_DUMP)
+
+    monkeypatch.setattr(sys, "_stats_dump", dump)
+    with pytest.raises(RuntimeError, match="found 2 candidate file"):
+        with collect_specialization_stats():
+            pass
+    # neither file is removed, since which one was written here is unknown
+    assert sorted(p.name for p in stats_dir.iterdir()) == sorted(
+        [DUMP_NAME, other.name]
+    )
+
+
+@pytest.mark.parametrize("kind", ["unrelated-name", "old", "other-user"])
+def test_collect_ignores_foreign_files(tmp_path, monkeypatch, fake_stats_build, kind):
+    stats_dir = tmp_path / "py_stats"
+    foreign = stats_dir / (
+        "notes.txt" if kind == "unrelated-name" else f"{'f' * 40}.txt"
+    )
+    dump = sys._stats_dump
+
+    def dump_with_foreign_file():
+        foreign.write_text("not ours")
+        if kind == "old":
+            os.utime(foreign, ns=(0, 0))
+        dump()
+
+    monkeypatch.setattr(sys, "_stats_dump", dump_with_foreign_file)
+    if kind == "other-user":
+        if not hasattr(os, "getuid"):
+            pytest.skip("file ownership is not checked")
+        uid = os.getuid()
+        real_lstat = Path.lstat
+
+        def lstat(self):
+            st = real_lstat(self)
+            if self != foreign:
+                return st
+            return os.stat_result((*st[:4], uid + 1, *st[5:]))
+
+        monkeypatch.setattr(Path, "lstat", lstat)
+
+    with collect_specialization_stats() as collector:
+        pass
+    assert collector.stats == parse_specialization_stats(STATS_DUMP)
+    assert [p.name for p in stats_dir.iterdir()] == [foreign.name]
+
+
+@pytest.mark.skipif(is_stats_build(), reason="requires a build without Py_STATS")
+def test_collect_unsupported():
+    with pytest.raises(
+        RuntimeError,
+        match=(
+            "^Collecting specialization statistics requires an interpreter "
+            "built with --enable-pystats$"
+        ),
+    ):
+        with collect_specialization_stats():
+            pass
+
+
+@cpython_only
+def test_feature_status():
+    fs = CPythonFeatureSet()
+    (ft,) = fs.snapshot(features=["specialization"])
+    assert ft.name == "specialization"
+    assert ft.status.available is is_stats_build()
+    assert ft.status.enabled is None
+    assert ft.status.details is not None
+
+
+@cpython_only
+def test_feature_status_fake_stats_build(fake_stats_build):
+    fs = CPythonFeatureSet()
+    if sys.version_info < (3, 11):
+        assert fs.supports("specialization") is False
+    else:
+        assert fs.supports("specialization") is True
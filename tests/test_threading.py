@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+
+from runtime_introspect._features import (
+    VALID_FEATURE_NAMES,
+    VALID_INTROSPECTIONS,
+    CPythonFeatureSet,
+)
+
+from .helpers import cpython_only
+
+N_THREADS = 8
+N_ITERATIONS = 200
+
+
+@cpython_only
+@pytest.mark.parametrize("introspection", VALID_INTROSPECTIONS)
+@pytest.mark.parametrize("shared_instance", [True, False], ids=["shared", "local"])
+def test_concurrent_calls(introspection, shared_instance):
+    # JIT activity is a property of the calling thread's frame, so it may
+    # legitimately differ across threads
+    features = [
+        name
+        for name in VALID_FEATURE_NAMES
+        if not (name == "JIT" and introspection == "unstable-inspect-activity")
+    ]
+    shared_fs = CPythonFeatureSet()
+    expected = (
+        shared_fs.snapshot(features=features, introspection=introspection),
+        shared_fs.diagnostics(features=features, introspection=introspection),
+        [shared_fs.supports(name, introspection=introspection) for name in features],
+    )
+    barrier = Barrier(N_THREADS)
+
+    def worker():
+        fs = shared_fs if shared_instance else CPythonFeatureSet()
+        barrier.wait()
+        results = []
+        for _ in range(N_ITERATIONS):
+            results.append(
+                (
+                    fs.snapshot(features=features, introspection=introspection),
+                    fs.diagnostics(features=features, introspection=introspection),
+                    [
+                        fs.supports(name, introspection=introspection)
+                        for name in features
+                    ],
+                )
+            )
+        return results
+
+    with ThreadPoolExecutor(max_workers=N_THREADS) as executor:
+        futures = [executor.submit(worker) for _ in range(N_THREADS)]
+        for future in futures:
+            assert all(res == expected for res in future.result())
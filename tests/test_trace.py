@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+from runtime_introspect._features import VALID_FEATURE_NAMES, Feature
+from runtime_introspect._status import Status
+from runtime_introspect._trace import TraceRecorder
+
+from .helpers import FakeFeatureSet, cpython_only
+
+ENABLED = Status(available=True, enabled=True, active=None)
+DISABLED = Status(
+    available=True,
+    enabled=False,
+    active=None,
+    details="global locking is forced by envvar PYTHON_GIL=1",
+)
+ACTIVE = Status(available=True, enabled=True, active=True)
+INACTIVE = Status(available=True, enabled=True, active=False)
+
+
+@pytest.fixture
+def fake_fs():
+    return FakeFeatureSet(
+        [
+            Feature(name="free-threading", status=ENABLED),
+            Feature(name="JIT", status=ACTIVE),
+        ]
+    )
+
+
+def test_trace(tmp_path, fake_fs):
+    path = tmp_path / "trace.json"
+    with TraceRecorder(path, fake_fs) as rec:
+        assert rec.sample() == []
+        fake_fs.features[0] = Feature(name="free-threading", status=DISABLED)
+        fake_fs.features[1] = Feature(name="JIT", status=INACTIVE)
+        transitions = rec.sample()
+        assert [tr.diagnostic for tr in transitions] == [
+            "free-threading: enabled -> disabled",
+            "JIT: active -> inactive",
+        ]
+    assert rec.closed
+    rec.close()
+
+    events = json.loads(path.read_text())
+    assert all(ev["pid"] == os.getpid() for ev in events)
+
+    metadata = [ev for ev in events if ev["ph"] == "M"]
+    assert len(metadata) == 1
+
+    instants = [ev for ev in events if ev["ph"] == "i"]
+    assert [ev["name"] for ev in instants] == [
+        "free-threading: enabled",
+        "JIT: active",
+        "free-threading: enabled -> disabled",
+        "JIT: active -> inactive",
+    ]
+    assert instants[2]["args"] == {
+        "old details": None,
+        "new details": "global locking is forced by envvar PYTHON_GIL=1",
+    }
+    assert all(ev["cat"] == "runtime-introspect" for ev in instants)
+
+    counters = [ev for ev in events if ev["ph"] == "C"]
+    threads = [ev for ev in counters if ev["name"] == "threads"]
+    assert len(threads) == 3
+    assert all(ev["args"]["count"] >= 1 for ev in threads)
+    assert len(counters) == len(threads)
+
+    timestamps = [ev["ts"] for ev in events if "ts" in ev]
+    assert timestamps == sorted(timestamps)
+
+
+def test_sample_after_close(tmp_path, fake_fs):
+    rec = TraceRecorder(tmp_path / "trace.json", fake_fs)
+    rec.close()
+    with pytest.raises(ValueError, match="^Cannot sample with a closed TraceRecorder$"):
+        rec.sample()
+
+
+@cpython_only
+def test_trace_default_feature_set(tmp_path):
+    path = tmp_path / "trace.json"
+    with TraceRecorder(path) as rec:
+        rec.sample()
+
+    events = json.loads(path.read_text())
+    instants = [ev for ev in events if ev["ph"] == "i"]
+    assert [ev["name"].partition(":")[0] for ev in instants] == VALID_FEATURE_NAMES
@@ -0,0 +1,517 @@
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from runtime_introspect import _watch
+from runtime_introspect._cli import main
+from runtime_introspect._features import CPythonFeatureSet, Feature
+from runtime_introspect._status import Status
+from runtime_introspect._watch import parse_interval, remote_exec_feature, watch
+
+from .helpers import cpython_only
+
+requires_remote_exec = pytest.mark.skipif(
+    not remote_exec_feature().status.enabled, reason="remote exec is unavailable"
+)
+
+
+@pytest.mark.parametrize(
+    "interval, expected",
+    [
+        ("1", 1.0),
+        ("1s", 1.0),
+        ("0.5", 0.5),
+        (".5s", 0.5),
+        ("500ms", 0.5),
+        (" 2 s ", 2.0),
+    ],
+)
+def test_parse_interval(interval, expected):
+    assert parse_interval(interval) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("interval", ["", "s", "1x", "-1s", "0", "0ms", "1 sec"])
+def test_parse_invalid_interval(interval):
+    with pytest.raises(ValueError, match="^Invalid interval"):
+        parse_interval(interval)
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 14), reason="remote exec may be supported")
+def test_remote_exec_unsupported():
+    ft = remote_exec_feature()
+    assert ft.diagnostic == (
+        "remote-exec: unavailable (sys.remote_exec only exists in Python 3.14 and newer)"
+    )
+
+
+@cpython_only
+@pytest.mark.skipif(sys.version_info >= (3, 14), reason="remote exec may be supported")
+def test_cli_remote_exec_unsupported(capsys):
+    ret = main(["watch", "--pid", "1"])
+    assert ret == 1
+    out, err = capsys.readouterr()
+    assert not out
+    assert err == f"{remote_exec_feature().diagnostic}\n"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 14), reason="sys.remote_exec is missing")
+@pytest.mark.parametrize(
+    "enabled, expected",
+    [
+        (True, "remote-exec: enabled"),
+        (
+            False,
+            "remote-exec: disabled (disabled by envvar PYTHON_DISABLE_REMOTE_DEBUG, "
+            "command line option -Xdisable-remote-debug, "
+            "or build option --without-remote-debug)",
+        ),
+    ],
+)
+def test_remote_exec_feature(monkeypatch, enabled, expected):
+    monkeypatch.setattr(sys, "is_remote_debug_enabled", lambda: enabled)
+    assert remote_exec_feature().diagnostic == expected
+
+
+@pytest.fixture
+def remote_exec_enabled(monkeypatch):
+    ft = Feature(
+        name="remote-exec", status=Status(available=True, enabled=True, active=None)
+    )
+    monkeypatch.setattr(_watch, "remote_exec_feature", lambda: ft)
+
+
+@cpython_only
+@pytest.mark.usefixtures("remote_exec_enabled")
+def test_cli_watch(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        _watch, "watch", lambda pid, **kwargs: calls.append((pid, kwargs))
+    )
+    ret = main(["--features", "JIT", "--debug", "watch", "--pid", "1", "--count", "2"])
+    assert ret == 0
+    assert calls == [(1, {"interval": 1.0, "features": ["JIT"], "count": 2})]
+
+
+@cpython_only
+@pytest.mark.usefixtures("remote_exec_enabled")
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        pytest.param(["watch", "--pid", "1", "--features", "JIT"], ["JIT"], id="after"),
+        pytest.param(
+            [
+                "--features",
+                "free-threading",
+                "--debug",
+                "watch",
+                "--pid",
+                "1",
+                "--features",
+                "JIT",
+            ],
+            ["JIT"],
+            id="override",
+        ),
+        pytest.param(["watch", "--pid", "1", "--features", "all"], "all", id="all"),
+    ],
+)
+def test_cli_watch_features(monkeypatch, argv, expected):
+    calls = []
+    monkeypatch.setattr(
+        _watch, "watch", lambda pid, **kwargs: calls.append(kwargs["features"])
+    )
+    assert main(argv) == 0
+    assert calls == [expected]
+
+
+@cpython_only
+def test_cli_watch_features_help(capsys):
+    with pytest.raises(SystemExit):
+        main(["watch", "--help"])
+    out, _ = capsys.readouterr()
+    assert f"among {', '.join(_watch.WATCHABLE_FEATURE_NAMES)} " in " ".join(
+        out.split()
+    )
+
+
+@cpython_only
+@pytest.mark.usefixtures("remote_exec_enabled")
+@pytest.mark.parametrize(
+    "exc, expected_ret, expected_err",
+    [
+        (KeyboardInterrupt(), 0, ""),
+        (ProcessLookupError("no such process"), 1, "no such process"),
+        (RuntimeError("no response"), 1, "no response"),
+    ],
+)
+def test_cli_watch_stopped(monkeypatch, capsys, exc, expected_ret, expected_err):
+    def watch(pid, **kwargs):
+        raise exc
+
+    monkeypatch.setattr(_watch, "watch", watch)
+    ret = main(["watch", "--pid", "1"])
+    assert ret == expected_ret
+    _, err = capsys.readouterr()
+    if expected_err:
+        assert err == f"Failed to sample process 1: {expected_err}\n"
+    else:
+        assert not err
+
+
+@cpython_only
+def test_cli_invalid_interval(capsys):
+    with pytest.raises(SystemExit):
+        main(["watch", "--pid", "1", "--interval", "soon"])
+    _, err = capsys.readouterr()
+    assert "Invalid interval 'soon'" in err
+
+
+def _execute_locally(pid, script):
+    # stand-in for sys.remote_exec, which executes in __main__'s namespace
+    namespace: dict[str, object] = {}
+    exec(Path(script).read_text(), namespace)
+    assert set(namespace) == {"__builtins__"}
+
+
+def _output_path(script):
+    n = Path(script).stem.removeprefix("payload-")
+    return Path(script).parent / "samples" / f"sample-{n}"
+
+
+def _respond_with(samples):
+    def remote_exec(pid, script):
+        # respond as the payload would, with the given facts
+        output = _output_path(script)
+        output.write_text(repr(next(samples)))
+
+    return remote_exec
+
+
+@cpython_only
+def test_watch_payload(monkeypatch, capsys):
+    monkeypatch.setattr(_watch, "_remote_exec", _execute_locally)
+    watch(1234, interval=0.001, count=2)
+    out, err = capsys.readouterr()
+    assert not err
+    lines = out.splitlines()
+    # the initial state is reported, but nothing changed afterwards
+    assert len(lines) == 3
+    assert lines[0] == "pid 1234:"
+    if sys.version_info >= (3, 14):
+        # the payload reaches the same conclusions as local introspection
+        fs = CPythonFeatureSet()
+        expected = fs.diagnostics(features=_watch.WATCHABLE_FEATURE_NAMES)
+        assert lines[1:] == [f"  {diagnostic}" for diagnostic in expected]
+    else:
+        assert lines[1].startswith("  free-threading: ")
+        assert lines[2].startswith("  JIT: ")
+
+
+@cpython_only
+def test_watch_payload_leaves_no_files(monkeypatch, tmp_path):
+    directories = []
+
+    def remote_exec(pid, script):
+        directories.append(Path(script).parent)
+        _execute_locally(pid, script)
+
+    monkeypatch.setattr(_watch, "_remote_exec", remote_exec)
+    watch(1234, interval=0.001, features=["JIT"], count=2)
+    assert len(directories) == 2
+    assert not directories[0].exists()
+
+
+def test_watch_transitions(monkeypatch, capsys):
+    samples = iter(
+        [
+            {"abiflags": "", "jit_available": True, "jit_enabled": False},
+            {"abiflags": "", "jit_available": True, "jit_enabled": False},
+            {"abiflags": "", "jit_available": True, "jit_enabled": True},
+            {"abiflags": "t", "jit_available": True, "jit_enabled": True},
+        ]
+    )
+    monkeypatch.setattr(_watch, "_remote_exec", _respond_with(samples))
+    watch(1234, interval=0.001, count=4)
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == [
+        "pid 1234:",
+        "  free-threading: unavailable "
+        "(this interpreter was built without free-threading support)",
+        "  JIT: disabled (envvar PYTHON_JIT is unset)",
+        "  JIT: disabled -> enabled",
+        "  free-threading: unavailable -> enabled",
+    ]
+
+
+@pytest.mark.parametrize(
+    "facts, expected",
+    [
+        pytest.param(
+            {"abiflags": "t", "gil_enabled": True, "gil_xoption": "1"},
+            "free-threading: disabled "
+            "(global locking is forced by command line option -Xgil=1)",
+            id="xoption-gil-1",
+        ),
+        pytest.param(
+            {"abiflags": "t", "gil_enabled": True, "PYTHON_GIL": "1"},
+            "free-threading: disabled (global locking is forced by envvar PYTHON_GIL=1)",
+            id="envvar-gil-1",
+        ),
+        pytest.param(
+            {"abiflags": "t", "gil_enabled": True},
+            "free-threading: disabled",
+            id="gil-enabled",
+        ),
+        pytest.param(
+            {"abiflags": "t", "gil_enabled": False, "gil_xoption": "0"},
+            "free-threading: enabled (forced by command line option -Xgil=0)",
+            id="xoption-gil-0",
+        ),
+        pytest.param(
+            {"abiflags": "t", "gil_enabled": False, "PYTHON_GIL": "0"},
+            "free-threading: enabled (forced by envvar PYTHON_GIL=0)",
+            id="envvar-gil-0",
+        ),
+        pytest.param(
+            {"abiflags": None},
+            "free-threading: unavailable "
+            "(this interpreter was built without free-threading support)",
+            id="no-abiflags",
+        ),
+    ],
+)
+def test_free_threading_from_facts(facts, expected):
+    assert _watch._free_threading_from_facts(facts).diagnostic == expected
+
+
+@pytest.mark.parametrize(
+    "facts, expected",
+    [
+        pytest.param(
+            {"jit_available": None},
+            "JIT: unavailable (this interpreter was built without JIT compilation support)",
+            id="no-jit",
+        ),
+        pytest.param(
+            {"jit_available": True, "jit_enabled": False, "PYTHON_JIT": "0"},
+            "JIT: disabled (forced by envvar PYTHON_JIT=0)",
+            id="envvar-jit-0",
+        ),
+        pytest.param(
+            {"jit_available": True, "jit_enabled": False, "PYTHON_JIT": None},
+            "JIT: disabled (envvar PYTHON_JIT is unset)",
+            id="envvar-unset",
+        ),
+        pytest.param(
+            {"jit_available": True, "jit_enabled": False, "PYTHON_JIT": "1"},
+            "JIT: disabled",
+            id="disabled-at-runtime",
+        ),
+        pytest.param(
+            {"jit_available": True, "jit_enabled": True, "PYTHON_JIT": "1"},
+            "JIT: enabled (by envvar PYTHON_JIT=1)",
+            id="envvar-jit-1",
+        ),
+    ],
+)
+def test_jit_from_facts(facts, expected):
+    assert _watch._jit_from_facts(facts).diagnostic == expected
+
+
+@pytest.mark.parametrize("content", ["", "[1, 2]", "{'a': f()}", "{"])
+def test_watch_invalid_sample(monkeypatch, content):
+    def remote_exec(pid, script):
+        output = _output_path(script)
+        output.write_text(content)
+
+    monkeypatch.setattr(_watch, "_remote_exec", remote_exec)
+    with pytest.raises(RuntimeError, match="^Invalid sample in "):
+        watch(1234, interval=0.001, count=1)
+
+
+def test_watch_unsupported_feature():
+    with pytest.raises(ValueError, match="cannot be sampled remotely"):
+        watch(1234, interval=0.001, features=["specialization"], count=1)
+
+
+def test_watch_unresponsive(monkeypatch, capsys):
+    monkeypatch.setattr(_watch, "_RESPONSE_TIMEOUT", 0.01)
+    monkeypatch.setattr(_watch, "_remote_exec", lambda pid, script: None)
+    with pytest.raises(RuntimeError, match="no response to 3 consecutive samples"):
+        watch(1234, interval=0.001)
+    out, err = capsys.readouterr()
+    assert not out
+    assert err.splitlines() == [
+        f"pid 1234: no response to sample #{n} within 0.01s" for n in (1, 2, 3)
+    ]
+
+
+def test_watch_keeps_timed_out_payloads(monkeypatch):
+    monkeypatch.setattr(_watch, "_RESPONSE_TIMEOUT", 0.01)
+    scripts = []
+    respond = _respond_with(iter([{"abiflags": "", "jit_available": None}]))
+
+    def remote_exec(pid, script):
+        scripts.append(Path(script))
+        if len(scripts) == 2:
+            # the target may still run the first payload, which must exist
+            assert scripts[0].exists()
+            respond(pid, script)
+
+    monkeypatch.setattr(_watch, "_remote_exec", remote_exec)
+    watch(1234, interval=0.001, count=2)
+    # all files are removed when watching stops
+    assert not scripts[0].parent.exists()
+
+
+def test_watch_remote_exec_failure(monkeypatch):
+    scripts = []
+
+    def remote_exec(pid, script):
+        scripts.append(Path(script))
+        raise ProcessLookupError("no such process")
+
+    monkeypatch.setattr(_watch, "_remote_exec", remote_exec)
+    with pytest.raises(ProcessLookupError):
+        watch(1234, interval=0.001, count=1)
+    assert not scripts[0].exists()
+
+
+def test_watch_missed_samples_are_not_fatal(monkeypatch, capsys):
+    monkeypatch.setattr(_watch, "_RESPONSE_TIMEOUT", 0.01)
+    responses = iter([True, False, False, True, False, False, True])
+    facts = iter([{"abiflags": "", "jit_available": None}] * 3)
+    respond = _respond_with(facts)
+
+    def remote_exec(pid, script):
+        if next(responses):
+            respond(pid, script)
+
+    monkeypatch.setattr(_watch, "_remote_exec", remote_exec)
+    watch(1234, interval=0.001, count=7)
+    out, err = capsys.readouterr()
+    assert out.startswith("pid 1234:\n")
+    assert len(err.splitlines()) == 4
+
+
+@cpython_only
+def test_cli_watch_unsupported_feature(capsys):
+    with pytest.raises(SystemExit):
+        main(["watch", "--pid", "1", "--features", "specialization"])
+    _, err = capsys.readouterr()
+    assert "feature 'specialization' cannot be sampled remotely" in err
+
+
+@cpython_only
+def test_cli_watch_unstable_introspection(capsys):
+    with pytest.raises(SystemExit):
+        main(
+            [
+                "--introspection",
+                "unstable-inspect-activity",
+                "watch",
+                "--pid",
+                "1",
+            ]
+        )
+    _, err = capsys.readouterr()
+    assert "only stable introspection is supported" in err
+
+
+@pytest.mark.parametrize(
+    "euid, target_uid, expected",
+    [
+        pytest.param(1000, 1001, None, id="not-root"),
+        pytest.param(0, 1001, 1001, id="root"),
+        pytest.param(0, 0, None, id="root-target"),
+        pytest.param(0, None, None, id="unknown-target"),
+    ],
+)
+def test_make_output_directory(monkeypatch, tmp_path, euid, target_uid, expected):
+    chowned = []
+    tmp_path.chmod(0o700)
+    monkeypatch.setattr(_watch.os, "geteuid", lambda: euid, raising=False)
+    monkeypatch.setattr(_watch, "_get_process_uid", lambda pid: target_uid)
+    monkeypatch.setattr(_watch.os, "chown", lambda *args: chowned.append(args))
+    output_dir = _watch._make_output_directory(tmp_path, 1234)
+    assert output_dir.parent == tmp_path
+    assert output_dir.is_dir()
+    # only the output directory is ever handed over to the target
+    assert chowned == ([] if expected is None else [(output_dir, expected, -1)])
+    if sys.platform != "win32":
+        mode = stat.S_IMODE(tmp_path.stat().st_mode)
+        assert mode == (0o700 if expected is None else 0o711)
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires symlinks")
+def test_write_payload_does_not_follow_symlinks(tmp_path):
+    target = tmp_path / "target"
+    target.write_text("precious")
+    payload = tmp_path / "payload-1.py"
+    try:
+        payload.symlink_to(target)
+    except OSError:  # pragma: no cover
+        pytest.skip("insufficient permissions to create symlinks")
+    with pytest.raises(OSError):
+        _watch._write_payload(payload, "pass")
+    assert target.read_text() == "precious"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires POSIX permissions")
+def test_write_payload_mode(tmp_path):
+    old_umask = os.umask(0o077)
+    try:
+        _watch._write_payload(tmp_path / "payload-1.py", "pass")
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE((tmp_path / "payload-1.py").stat().st_mode) == 0o644
+    assert (tmp_path / "payload-1.py").read_text() == "pass"
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires symlinks")
+def test_read_snapshot_does_not_follow_symlinks(tmp_path):
+    target = tmp_path / "target"
+    target.write_text(repr({"abiflags": ""}))
+    output = tmp_path / "sample-1"
+    try:
+        output.symlink_to(target)
+    except OSError:  # pragma: no cover
+        pytest.skip("insufficient permissions to create symlinks")
+    with pytest.raises(OSError):
+        _watch._read_snapshot(output, ["JIT"])
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires FIFOs")
+def test_read_snapshot_rejects_special_files(tmp_path):
+    output = tmp_path / "sample-1"
+    os.mkfifo(output)
+    with pytest.raises(RuntimeError, match="^Invalid sample in "):
+        _watch._read_snapshot(output, ["JIT"])
+
+
+def test_read_snapshot_rejects_large_files(tmp_path):
+    output = tmp_path / "sample-1"
+    output.write_text(repr({"abiflags": " " * _watch._MAX_SAMPLE_SIZE}))
+    with pytest.raises(RuntimeError, match="^Invalid sample in "):
+        _watch._read_snapshot(output, ["JIT"])
+
+
+@requires_remote_exec
+def test_watch_live_process(tmp_path, capsys):  # pragma: no cover
+    import subprocess
+
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import time\nwhile True: time.sleep(0.01)"]
+    )
+    try:
+        ret = main(["watch", "--pid", str(proc.pid), "--count", "2"])
+    finally:
+        proc.kill()
+        proc.wait()
+    out, err = capsys.readouterr()
+    if ret != 0:
+        pytest.skip(f"insufficient permissions to sample processes: {err}")
+    assert out.startswith(f"pid {proc.pid}:\n")